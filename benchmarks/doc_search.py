@@ -0,0 +1,158 @@
+"""
+Compare the ranked /doc-search scorer against the old substring scan.
+
+Builds doc entries (synthetic, or a coolbot.json file), generates queries from entry names
+and reports per-query latency and recall@k for both: the old scan returns every name
+containing the query in table order, the ranked scorer returns DocIndex.rank(query, k).
+
+Query sets:
+    substring  a contiguous run of one to three words of the name, what the scan was built for
+    word       a single word of the name
+    words      two words of the name in random order, never a substring so the scan can't find it
+    typo       like words, with one typo
+The last lines compare latency over all sets, the ranked scorer has the slower tail.
+
+    python benchmarks/doc_search.py --entries 5000 --queries 2000
+    python benchmarks/doc_search.py --json coolbot.json
+"""
+import argparse
+import json
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from utils.doc_index import DocIndex, WORD_RE  # noqa: E402
+
+SERVICES = [
+    "postgresql", "mysql", "mariadb", "redis", "mongodb", "clickhouse", "minio", "plausible",
+    "umami", "n8n", "supabase", "appwrite", "ghost", "wordpress", "nextcloud", "gitea",
+    "uptime kuma", "grafana", "metabase", "directus", "strapi", "pocketbase", "keycloak", "authentik",
+]
+TOPICS = [
+    "deploy", "backup", "restore", "upgrade", "configure", "migrate", "scale", "monitor",
+    "troubleshoot", "secure", "install", "connect",
+]
+THINGS = [
+    "docker compose", "dockerfile", "nixpacks", "static site", "private repository", "github app",
+    "custom domain", "wildcard certificate", "traefik proxy", "caddy proxy", "cloudflare tunnel",
+    "s3 storage", "environment variables", "build pack", "health checks", "webhooks", "api tokens",
+    "server", "destination", "preview deployments", "persistent storage", "cron jobs",
+]
+
+def synthetic_entries(count: int, rng: random.Random) -> list:
+    names = set()
+    while len(names) < count:
+        pattern = rng.randrange(3)
+        if pattern == 0:
+            name = f"How to {rng.choice(TOPICS)} {rng.choice(SERVICES)}"
+        elif pattern == 1:
+            name = f"{rng.choice(THINGS).title()} with {rng.choice(SERVICES).title()}"
+        else:
+            name = f"{rng.choice(TOPICS).title()} {rng.choice(THINGS)} on {rng.choice(SERVICES)}"
+        name = f"{name} ({len(names)})" if name in names else name
+        names.add(name)
+    return [{"name": name, "link": f"https://coolify.io/docs/{i}"} for i, name in enumerate(sorted(names))]
+
+def typo(word: str, rng: random.Random) -> str:
+    """One deletion, substitution, insertion or transposition"""
+    i = rng.randrange(len(word))
+    kind = rng.randrange(4)
+    if kind == 0:
+        return word[:i] + word[i + 1:]
+    if kind == 1:
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    if kind == 2:
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    if i == len(word) - 1:
+        i -= 1
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+def make_queries(entries: list, count: int, kind: str, rng: random.Random) -> list:
+    queries = []
+    while len(queries) < count:
+        target = rng.randrange(len(entries))
+        name = entries[target]["name"].lower()
+        if kind == "substring":
+            spans = [match.span() for match in WORD_RE.finditer(name)]
+            first = rng.randrange(len(spans))
+            last = min(len(spans), first + rng.randint(1, 3)) - 1
+            queries.append((name[spans[first][0]:spans[last][1]], target))
+            continue
+        words = [w for w in WORD_RE.findall(name) if len(w) >= 4]
+        if kind == "word":
+            if words:
+                queries.append((rng.choice(words), target))
+            continue
+        if len(words) < 2:
+            continue
+        picked = rng.sample(words, 2)
+        if kind == "typo":
+            i = rng.randrange(2)
+            picked[i] = typo(picked[i], rng)
+        queries.append((" ".join(picked), target))
+    return queries
+
+def substring_scan(entries: list, query: str) -> list:
+    """What /doc-search did before: every name containing the query, in table order"""
+    query = query.lower()
+    return [entry for entry in entries if query in entry["name"].lower()]
+
+def measure(search, queries: list, entries: list, k: int):
+    latencies, hits = [], 0
+    for query, target in queries:
+        start = time.perf_counter()
+        results = search(query)
+        latencies.append(time.perf_counter() - start)
+        if entries[target] in results[:k]:
+            hits += 1
+    return latencies, hits / len(queries)
+
+def summarize(latencies: list):
+    """Mean and p95 in microseconds"""
+    latencies = sorted(latencies)
+    return statistics.mean(latencies) * 1e6, latencies[int(len(latencies) * 0.95)] * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=5000, help="number of synthetic doc entries")
+    parser.add_argument("--json", type=Path, help="use a coolbot.json file instead of synthetic entries")
+    parser.add_argument("--queries", type=int, default=2000, help="queries per run")
+    parser.add_argument("-k", type=int, default=5, help="results that count for recall")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    entries = json.loads(args.json.read_text()) if args.json else synthetic_entries(args.entries, rng)
+    index = DocIndex()
+    start = time.perf_counter()
+    index.rebuild(entries)
+    print(f"entries={len(index)} index build={time.perf_counter() - start:.3f}s k={args.k}")
+
+    searches = (
+        ("substring", lambda q: substring_scan(index.entries, q)),
+        ("ranked", lambda q: index.rank(q, args.k)),
+    )
+    overall = {name: [] for name, _ in searches}
+    print(f"{'queries':<11}{'search':<12}{'mean (us)':>12}{'p95 (us)':>12}{'recall@k':>11}")
+    for kind in ("substring", "word", "words", "typo"):
+        queries = make_queries(index.entries, args.queries, kind, rng)
+        for name, search in searches:
+            latencies, recall = measure(search, queries, index.entries, args.k)
+            overall[name].extend(latencies)
+            mean, p95 = summarize(latencies)
+            print(f"{kind:<11}{name:<12}{mean:>12.1f}{p95:>12.1f}{recall:>11.3f}")
+
+    print()
+    for name, latencies in overall.items():
+        mean, p95 = summarize(latencies)
+        print(f"all queries, {name}: mean {mean:.1f}us, p95 {p95:.1f}us")
+    substring_p95, ranked_p95 = (summarize(overall[name])[1] for name, _ in searches)
+    print(f"ranked p95 is {ranked_p95 / substring_p95:.2f}x the substring scan's")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Offline evaluation of the doc suggestions posted on new support posts.
+
+Scores labeled posts against the doc entries with DocSuggester and reports, per threshold,
+how often a suggestion is made, how often the expected doc is among them (recall) and how
+often suggestions are right (precision), plus the per-post latency.
+
+Labeled posts are JSON lines: {"text": "...", "expected": ["Doc name", ...]}, with an empty
+expected list for posts no doc answers. Without files, synthetic docs and posts are used.
+
+    python benchmarks/doc_suggestions.py
+    python benchmarks/doc_suggestions.py --docs coolbot.json --posts labeled_posts.jsonl
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from utils.doc_suggester import DocSuggester  # noqa: E402
+from doc_search import synthetic_entries, typo  # noqa: E402
+
+FILLER = [
+    "Hi everyone, I have been stuck on this for hours.",
+    "It worked yesterday and now it does not.",
+    "I followed the guide but something is off.",
+    "Any idea what I am doing wrong here?",
+    "Running the latest version on a Hetzner VPS.",
+    "Logs below, thanks in advance!",
+]
+OFF_TOPIC = [
+    "Is there a discount for students on the cloud plan?",
+    "My invoice shows the wrong company address.",
+    "Can someone review my pull request for the landing page copy?",
+    "When is the next community call happening?",
+    "The dashboard looks weird in dark mode on Safari.",
+]
+
+def synthetic_posts(entries: list, count: int, rng: random.Random) -> list:
+    posts = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            posts.append({"text": rng.choice(OFF_TOPIC), "expected": []})
+            continue
+        entry = rng.choice(entries)
+        words = entry["name"].lower().split()
+        if rng.random() < 0.3:
+            i = rng.randrange(len(words))
+            if len(words[i]) > 3:
+                words[i] = typo(words[i], rng)
+        rng.shuffle(words)
+        text = f"{rng.choice(FILLER)} Trying to {' '.join(words)}. {rng.choice(FILLER)}"
+        posts.append({"text": text, "expected": [entry["name"]]})
+    return posts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=Path, help="coolbot.json with the doc entries")
+    parser.add_argument("--posts", type=Path, help="labeled posts, one JSON object per line")
+    parser.add_argument("--entries", type=int, default=2000, help="number of synthetic doc entries")
+    parser.add_argument("--count", type=int, default=2000, help="number of synthetic posts")
+    parser.add_argument("--limit", type=int, default=3, help="suggestions per post")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.1, 0.2, 0.3, 0.4, 0.5])
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    entries = json.loads(args.docs.read_text()) if args.docs else synthetic_entries(args.entries, rng)
+    if args.posts:
+        posts = [json.loads(line) for line in args.posts.read_text().splitlines() if line.strip()]
+    else:
+        posts = synthetic_posts(entries, args.count, rng)
+
+    suggester = DocSuggester()
+    start = time.perf_counter()
+    suggester.rebuild(entries)
+    print(f"docs={len(suggester)} terms={len(suggester.postings)} build={time.perf_counter() - start:.3f}s "
+          f"posts={len(posts)} limit={args.limit}")
+
+    latencies = []
+    ranked = []
+    for post in posts:
+        start = time.perf_counter()
+        suggestions = suggester.suggest(post["text"], args.limit, threshold=0.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ranked.append(suggestions)
+    latencies.sort()
+    print(f"latency ms: mean={statistics.mean(latencies):.3f} p95={latencies[int(len(latencies) * 0.95)]:.3f} "
+          f"max={latencies[-1]:.3f}")
+
+    answerable = sum(1 for post in posts if post["expected"])
+    unanswerable = len(posts) - answerable
+    print(f"{'threshold':>10}{'suggested':>11}{'recall':>9}{'precision':>11}{'false alarm':>13}")
+    for threshold in args.thresholds:
+        suggested = hits = correct = shown = false_alarms = 0
+        for post, suggestions in zip(posts, ranked):
+            names = [entry["name"] for entry, score in suggestions if score >= threshold]
+            if not names:
+                continue
+            suggested += 1
+            shown += len(names)
+            correct += sum(1 for name in names if name in post["expected"])
+            if not post["expected"]:
+                false_alarms += 1
+            elif any(name in post["expected"] for name in names):
+                hits += 1
+        print(f"{threshold:>10.2f}{suggested / len(posts):>11.3f}"
+              f"{hits / answerable if answerable else 0:>9.3f}"
+              f"{correct / shown if shown else 0:>11.3f}"
+              f"{false_alarms / unanswerable if unanswerable else 0:>13.3f}")
+
+if __name__ == "__main__":
+    main()
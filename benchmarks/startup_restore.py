@@ -0,0 +1,159 @@
+"""
+Benchmark the startup restore path against a large database.
+
+Fills a throwaway database with scheduled closes and persistent views, then runs
+Scheduler.initialize_tasks, the catch-up of overdue jobs and load_persistent_views
+against fake channel objects and reports wall time, peak RSS and the number of
+asyncio tasks left running.
+
+    python benchmarks/startup_restore.py --jobs 50000 --views 50000 --overdue-fraction 0.1
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+# config.py requires every ID to be set, the values don't matter here
+for name in re.findall(r"int\(os\.getenv\('(\w+)'\)\)", (SRC / "config.py").read_text()):
+    os.environ.setdefault(name, "0")
+
+VIEW_TYPES = ["solved", "not_solved", "confirm_close", "submit_info", "incomplete", "alert"]
+
+class FakeThread:
+    def __init__(self, thread_id: int):
+        self.id = thread_id
+        self.archived = False
+        self.locked = False
+        self.applied_tags = []
+
+class FakeLogSink:
+    def __init__(self):
+        self.entries = []
+
+    def log(self, channel_id: int, content=None, embed=None):
+        self.entries.append((channel_id, content, embed))
+
+class FakeBot:
+    """Just enough of commands.Bot for the restore path"""
+
+    def __init__(self, db):
+        self.db = db
+        self.user = None
+        self.views = 0
+        self.dynamic_items = 0
+        self.channels = {}
+        self.log_sink = FakeLogSink()
+
+    def get_channel(self, channel_id: int):
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            channel = self.channels[channel_id] = FakeThread(channel_id)
+        return channel
+
+    def get_user(self, user_id: int):
+        return None
+
+    def add_view(self, view, *, message_id=None):
+        self.views += 1
+
+    def add_dynamic_items(self, *items):
+        self.dynamic_items += len(items)
+
+def peak_rss_mb() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return usage / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+def fill_database(db_path: Path, jobs: int, views: int, overdue_fraction: float):
+    now = int(time.time())
+    rng = random.Random(42)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO scheduled_jobs (job_id, job_type, due_at, payload) VALUES (?, ?, ?, ?)",
+        (
+            (
+                f"post_close:{1000 + i}",
+                "post_close",
+                now - rng.randint(1, 3600) if rng.random() < overdue_fraction else now + rng.randint(60, 43200),
+                f'{{"thread_id": {1000 + i}}}'
+            )
+            for i in range(jobs)
+        )
+    )
+    conn.executemany(
+        """INSERT INTO persistent_views (message_id, channel_id, thread_id, view_type, post_owner_id, is_solved)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        (
+            (10_000_000 + i, 1, 1000 + i, VIEW_TYPES[i % len(VIEW_TYPES)], 500 + i, 0)
+            for i in range(views)
+        )
+    )
+    conn.commit()
+    conn.close()
+
+async def timed(label: str, results: list, coro):
+    start = time.perf_counter()
+    await coro
+    results.append((label, time.perf_counter() - start, peak_rss_mb(), len(asyncio.all_tasks())))
+
+async def run(args):
+    from utils.database import Database
+    from utils.view_loader import load_persistent_views
+    import tasks.scheduler as scheduler_module
+    from tasks.scheduler import Scheduler
+
+    scheduler_module.CATCH_UP_INTERVAL = args.catch_up_interval
+
+    db = Database()
+    await db.init()
+    fill_database(db.db_path, args.jobs, args.views, args.overdue_fraction)
+
+    bot = FakeBot(db)
+    bot.scheduler = Scheduler(bot)
+
+    async def noop(job):
+        pass
+    bot.scheduler.register("post_close", noop)
+
+    results = [("baseline", 0.0, peak_rss_mb(), len(asyncio.all_tasks()))]
+    await timed("Scheduler.initialize_tasks", results, bot.scheduler.initialize_tasks())
+    if bot.scheduler.catch_up_task is not None:
+        await timed("Scheduler.catch_up", results, bot.scheduler.catch_up_task)
+    await timed("load_persistent_views", results, load_persistent_views(bot))
+
+    print(f"jobs={args.jobs} views={args.views} overdue_fraction={args.overdue_fraction}")
+    print(f"{'phase':<28}{'wall (s)':>10}{'peak RSS (MB)':>16}{'tasks':>8}")
+    for label, wall, rss, tasks in results:
+        print(f"{label:<28}{wall:>10.3f}{rss:>16.1f}{tasks:>8}")
+    print(f"heap entries: {len(bot.scheduler.deadlines)} | views registered: {bot.views} | "
+          f"dynamic items registered: {bot.dynamic_items}")
+    for _, _, embed in bot.log_sink.entries:
+        print(embed.description.replace("**", ""))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50_000, help="number of scheduled closes")
+    parser.add_argument("--views", type=int, default=50_000, help="number of persistent views")
+    parser.add_argument("--overdue-fraction", type=float, default=0.0,
+                        help="share of jobs that are already overdue at startup")
+    parser.add_argument("--catch-up-interval", type=float, default=0.0,
+                        help="seconds between overdue jobs during catch-up (the bot uses 0.5, "
+                             "0 measures the overhead without the pacing)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # Database() writes to ./database/bot.db
+        asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
+import logging
 import discord
+import time
 from discord.ext import commands
 from config import (
     SUPPORT_CHANNEL_ID,
     UNANSWERED_TAG_ID,
     SOLVED_TAG_ID,
     NOT_SOLVED_TAG_ID,
-    WAITING_FOR_REPLY_TAG_ID
+    WAITING_FOR_REPLY_TAG_ID,
+    DOC_SUGGEST_THRESHOLD,
+    DOC_SUGGEST_LIMIT
 )
 
+logger = logging.getLogger(__name__)
+
+SUGGEST_BUDGET_MS = 5
+
 class AutoAddCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -39,6 +47,27 @@ class AutoAddCog(commands.Cog):
                 "While you wait, you can refer to our [documentation](https://coolify.io/docs/) for potential solutions."
             ))
             await thread.send(embed=support_embed)
+            await self.suggest_docs(thread, message)
+
+    async def suggest_docs(self, thread: discord.Thread, message: discord.Message):
+        """Post the docs closest to the new post's title and starter message, if any are close enough."""
+        if DOC_SUGGEST_LIMIT <= 0:
+            return
+        start = time.perf_counter()
+        suggestions = self.bot.doc_suggester.suggest(
+            f"{thread.name}\n{message.content}", DOC_SUGGEST_LIMIT, DOC_SUGGEST_THRESHOLD
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > SUGGEST_BUDGET_MS:
+            logger.warning(f"Doc suggestions for thread {thread.id} took {elapsed_ms:.1f}ms", extra={"event": "doc_suggest_slow", "guild_id": thread.guild.id, "thread_id": thread.id, "latency_ms": elapsed_ms})
+        if not suggestions:
+            return
+        embed = discord.Embed(
+            title="These docs might help",
+            description="\n".join(f"- [{entry['name']}]({entry['link']})" for entry, _ in suggestions),
+            color=discord.Color.blue()
+        )
+        await thread.send(embed=embed)
 
     async def handle_reply(self, message: discord.Message):
         """Replace 'Unanswered' with 'Not Solved' when someone replies, if applicable."""
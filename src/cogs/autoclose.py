@@ -1,25 +1,43 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import typing
-import asyncio
+import re
 from config import (
     SUPPORT_CHANNEL_ID,
     AUTHORIZED_ROLE_ID,
     SOLVED_TAG_ID,
     COOLIFY_CLOUD_TAG_ID
 )
-from datetime import datetime, timedelta, timezone
-
-class ConfirmCloseView(discord.ui.View):
-    def __init__(self, bot: commands.Bot, post: discord.Thread, authorized_role_id: int, post_owner_id: int):
-        super().__init__(timeout=None)
+from tasks.post_closer import resolve_thread
+from commands.solved import thread_from_match
+
+class ConfirmCloseButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"confirm_(?P<action>solve|cancel)(?::(?P<thread_id>[0-9]+):(?P<owner_id>[0-9]+))?"
+):
+    def __init__(self, bot: commands.Bot, post: discord.Thread, authorized_role_id: int, post_owner_id: int, action: str):
+        if action == "solve":
+            button = discord.ui.Button(label="Mark as Solved", style=discord.ButtonStyle.green)
+        else:
+            button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.gray)
+        button.custom_id = f"confirm_{action}:{post.id}:{post_owner_id}"
+        super().__init__(button)
         self.bot = bot
         self.post = post
         self.authorized_role_id = authorized_role_id
         self.post_owner_id = post_owner_id
-        self.timer_task = None
-        self.message = None
-        self.custom_id = f"confirm_close_{post.id}"
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match):
+        post = await thread_from_match(interaction, match)
+        if match["owner_id"]:
+            post_owner_id = int(match["owner_id"])
+        else:
+            # Sent before the owner was encoded, fall back to the stored view metadata
+            view_data = await interaction.client.db.get_view(interaction.message.id)
+            post_owner_id = view_data['post_owner_id'] if view_data else post.owner_id
+        return cls(interaction.client, post, AUTHORIZED_ROLE_ID, post_owner_id, match["action"])
 
     def is_authorized(self, user: discord.Member):
         return user.id == self.post_owner_id or any(role.id == self.authorized_role_id for role in user.roles)
@@ -37,35 +55,13 @@ class ConfirmCloseView(discord.ui.View):
             # Message might have been deleted or embeds might not exist, continue anyway
             pass
 
-    async def start_timer(self):
-        self.timer_task = asyncio.create_task(self.auto_close())
-
-    async def auto_close(self):
-        """Simple 5-minute timer for post auto-close"""
-        await asyncio.sleep(300)  # 5 minutes
-        try:
-            # Close the thread after timer expires
-            solved_tag = self.post.parent.get_tag(SOLVED_TAG_ID)
-            coolify_tag = self.post.parent.get_tag(COOLIFY_CLOUD_TAG_ID)
-            
-            new_tags = [solved_tag]
-            if coolify_tag and coolify_tag in self.post.applied_tags:
-                new_tags.append(coolify_tag)
-
-            await self.post.edit(applied_tags=new_tags, locked=True, archived=True)
-            await self.post.send(
-                embed=discord.Embed(
-                    title="Post Automatically Closed",
-                    description="This post has been marked as solved due to inactivity from the post owner.",
-                    color=discord.Color.green()
-                )
-            )
-            await self.bot.db.remove_view(self.message.id)
-        except Exception as e:
-            print(f"Error auto-closing thread: {e}")
+    async def callback(self, interaction: discord.Interaction):
+        if self.action == "solve":
+            await self.confirm(interaction)
+        else:
+            await self.cancel(interaction)
 
-    @discord.ui.button(label="Mark as Solved", style=discord.ButtonStyle.green, custom_id="confirm_solve")
-    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def confirm(self, interaction: discord.Interaction):
         if not self.is_authorized(interaction.user):
             embed = discord.Embed(description="You are not authorized to close this post.", color=discord.Color.red())
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -73,8 +69,7 @@ class ConfirmCloseView(discord.ui.View):
 
         await interaction.response.defer()
         
-        if self.timer_task:
-            self.timer_task.cancel()  # Stop timer since user confirmed manually
+        await self.bot.scheduler.cancel("confirm_close", self.post.id)  # Stop timer since user confirmed manually
             
         solved_tag = interaction.channel.parent.get_tag(SOLVED_TAG_ID)
         coolify_tag = interaction.channel.parent.get_tag(COOLIFY_CLOUD_TAG_ID)
@@ -91,8 +86,7 @@ class ConfirmCloseView(discord.ui.View):
             # View might have been cleaned up already by message deletion handler
             pass
 
-    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.gray, custom_id="confirm_cancel")
-    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def cancel(self, interaction: discord.Interaction):
         if not self.is_authorized(interaction.user):
             embed = discord.Embed(description="You are not authorized to cancel this action.", color=discord.Color.red())
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -100,8 +94,7 @@ class ConfirmCloseView(discord.ui.View):
 
         await interaction.response.defer()
         
-        if self.timer_task:
-            self.timer_task.cancel()  # Stop timer if user cancels
+        await self.bot.scheduler.cancel("confirm_close", self.post.id)  # Stop timer if user cancels
             
         await self.update_embed(interaction, solved=None)
         try:
@@ -110,9 +103,31 @@ class ConfirmCloseView(discord.ui.View):
             # View might have been cleaned up already by message deletion handler
             pass
 
+class ConfirmCloseView(discord.ui.View):
+    def __init__(self, bot: commands.Bot, post: discord.Thread, authorized_role_id: int, post_owner_id: int):
+        super().__init__(timeout=None)
+        self.bot = bot
+        self.post = post
+        self.message = None
+        self.job = None
+        for action in ("solve", "cancel"):
+            self.add_item(ConfirmCloseButton(bot, post, authorized_role_id, post_owner_id, action))
+
+    async def start_timer(self, delay: int = 300) -> int:
+        """Schedule the auto-close for this post. Returns the close timestamp."""
+        self.job = await self.bot.scheduler.schedule("confirm_close", self.post.id, delay, {"thread_id": self.post.id})
+        return self.job.due_at
+
+    async def attach(self, message: discord.Message):
+        """Remember the prompt message, the auto-close removes its persistent view"""
+        self.message = message
+        await self.bot.scheduler.update_payload(self.job, message_id=message.id)
+
 class AutoCloseCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        bot.scheduler.register("confirm_close", self.confirm_close_auto_close)
+        bot.scheduler.register("owner_leave_close", self.owner_leave_auto_close)
 
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
@@ -133,15 +148,18 @@ class AutoCloseCog(commands.Cog):
         if thread.archived or thread.locked:
             return
         post_owner_id = await self.get_post_owner_id(thread, cached_message)
-        future_timestamp = int((datetime.now(timezone.utc) + timedelta(minutes=5)).timestamp())
+        view = ConfirmCloseView(self.bot, thread, AUTHORIZED_ROLE_ID, post_owner_id)
+        close_at = await view.start_timer()
         embed = discord.Embed(
             title="First Message Deleted",
-            description=f"The first message in this post has been deleted.\n\n**Would you like to mark this as solved?**\n\n*If no action is taken, this post will automatically close <t:{future_timestamp}:R>.*",
+            description=f"The first message in this post has been deleted.\n\n**Would you like to mark this as solved?**\n\n*If no action is taken, this post will automatically close <t:{close_at}:R>.*",
             color=discord.Color.orange()
         )
-        view = ConfirmCloseView(self.bot, thread, AUTHORIZED_ROLE_ID, post_owner_id)
-        message = await thread.send(content=f"Hey <@{post_owner_id}> !", embed=embed, view=view)
-        view.message = message  
+        try:
+            message = await thread.send(content=f"Hey <@{post_owner_id}> !", embed=embed, view=view)
+        except discord.HTTPException:
+            await self.bot.scheduler.cancel("confirm_close", thread.id)  # nobody was asked, don't close
+            raise
         
         # Add view to the database
         await self.bot.db.add_view(
@@ -151,9 +169,30 @@ class AutoCloseCog(commands.Cog):
             view_type="confirm_close",
             post_owner_id=post_owner_id
         )
-        
-        self.bot.add_view(view, message_id=message.id)
-        await view.start_timer()
+        await view.attach(message)
+
+    async def confirm_close_auto_close(self, job):
+        """Close the post when nobody answered the "First Message Deleted" prompt in time"""
+        post = await resolve_thread(self.bot, job.payload["thread_id"])
+        if post is None or post.locked:
+            return
+        solved_tag = post.parent.get_tag(SOLVED_TAG_ID)
+        coolify_tag = post.parent.get_tag(COOLIFY_CLOUD_TAG_ID)
+
+        new_tags = [solved_tag]
+        if coolify_tag and coolify_tag in post.applied_tags:
+            new_tags.append(coolify_tag)
+
+        await post.edit(applied_tags=new_tags, locked=True, archived=True)
+        await post.send(
+            embed=discord.Embed(
+                title="Post Automatically Closed",
+                description="This post has been marked as solved due to inactivity from the post owner.",
+                color=discord.Color.green()
+            )
+        )
+        if "message_id" in job.payload:
+            await self.bot.db.remove_view(job.payload["message_id"])
 
     async def get_post_owner_id(self, thread: discord.Thread, cached_message: typing.Optional[discord.Message]) -> int:
         if cached_message:
@@ -177,41 +216,35 @@ class AutoCloseCog(commands.Cog):
         # Iterate over active threads in the support channel
         for thread in channel.threads:
             if thread.owner_id == member.id and not thread.archived and not thread.locked:
-                future_timestamp = int((datetime.now(timezone.utc) + timedelta(minutes=5)).timestamp())
+                job = await self.bot.scheduler.schedule("owner_leave_close", thread.id, 300, {"thread_id": thread.id})
                 embed = discord.Embed(
                     title="Post Owner Left",
                     description=(
                         f"<@{member.id}> has left the server.\n\n"
-                        f"This post will automatically close <t:{future_timestamp}:R>."
+                        f"This post will automatically close <t:{job.due_at}:R>."
                     ),
                     color=discord.Color.orange()
                 )
                 await thread.send(embed=embed)
-                # Add close task to db
-                await self.bot.db.add_close_task(thread.id, future_timestamp)
-                self.bot.loop.create_task(self._owner_leave_auto_close(thread))
 
-    async def _owner_leave_auto_close(self, thread: discord.Thread):
-        await asyncio.sleep(300)  # 5 minutes delay
-        try:
-            solved_tag = thread.parent.get_tag(SOLVED_TAG_ID)
-            coolify_tag = thread.parent.get_tag(COOLIFY_CLOUD_TAG_ID)
-            new_tags = [solved_tag]
-            if coolify_tag and coolify_tag in thread.applied_tags:
-                new_tags.append(coolify_tag)
-            await thread.edit(locked=True, applied_tags=new_tags)
-            await thread.edit(archived=True)
-            await thread.send(
-                embed=discord.Embed(
-                    title="Post Solved",
-                    description="This post has been marked as solved since the owner left the server.",
-                    color=discord.Color.green()
-                )
+    async def owner_leave_auto_close(self, job):
+        thread = await resolve_thread(self.bot, job.payload["thread_id"])
+        if thread is None or thread.locked:
+            return
+        solved_tag = thread.parent.get_tag(SOLVED_TAG_ID)
+        coolify_tag = thread.parent.get_tag(COOLIFY_CLOUD_TAG_ID)
+        new_tags = [solved_tag]
+        if coolify_tag and coolify_tag in thread.applied_tags:
+            new_tags.append(coolify_tag)
+        await thread.edit(locked=True, applied_tags=new_tags)
+        await thread.edit(archived=True)
+        await thread.send(
+            embed=discord.Embed(
+                title="Post Solved",
+                description="This post has been marked as solved since the owner left the server.",
+                color=discord.Color.green()
             )
-            # Remove close task from db
-            await self.bot.db.remove_close_task(thread.id)
-        except Exception as e:
-            logger.error(f"Error auto-closing thread on owner leave: {e}")
+        )
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoCloseCog(bot))
@@ -74,18 +74,18 @@ class Automoderation(commands.Cog):
                     )
                     await message.channel.send(embed=embed_trigger)
 
-                    # Send full embed to report channel
+                    # Send full embed to report channel, the ping goes out with it
+                    # Sent directly, not through the log sink: moderation alerts must never be delayed or dropped
                     report_channel = self.bot.get_channel(AUTOMOD_REPORT_CHANNEL_ID)
                     if report_channel:
                         ping = f"<@&{REPORTS_PING_ROLE_ID}>"
-                        await report_channel.send(ping)
                         embed_report = discord.Embed(title="Automoderation Triggered", color=discord.Color.green())
                         embed_report.add_field(name="User", value=f" - {message.author.mention} (`{message.author.id}`)", inline=True)
                         embed_report.add_field(name="Channel", value=f" - {message.channel.mention}", inline=False)
                         embed_report.add_field(name="Rule", value=f"```\n{am['name']}\n```", inline=False)
                         embed_report.add_field(name="Reason", value=f"```\n{am['reason']}\n```", inline=False)
-                        embed_report.add_field(name="Message", value=f"```\n{message.content[:1024]}\n```", inline=False)
-                        await report_channel.send(embed=embed_report)
+                        embed_report.add_field(name="Message", value=f"```\n{message.content[:1000]}\n```", inline=False)
+                        await report_channel.send(ping, embed=embed_report)
 
                     # Delete all messages from user in last 5 minutes
                     cutoff = discord.utils.utcnow() - timedelta(minutes=5)
@@ -2,13 +2,12 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, button, Button, Modal, TextInput
-import aiohttp
-import asyncio
 import secrets
 import string
-from typing import List
 
-from config import CONTRIBUTORS_CHANNEL_ID, CONTRIBUTOR_ROLE_ID, REPOSITORIES
+from config import CONTRIBUTORS_CHANNEL_ID, CONTRIBUTOR_ROLE_ID
+from tasks.contributors_sync import format_summary
+from tasks.contributor_verifier import VERIFY_WINDOW_MINUTES
 
 def generate_verification_token():
     """Generate a random verification token"""
@@ -48,9 +47,9 @@ class GitHubUsernameVerificationModal(discord.ui.Modal):
     async def on_submit(self, interaction: discord.Interaction):
         github_username = self.github_username.value.strip()
 
-        # Get stored verification token
-        stored_token = await self.cog.bot.db.get_verification_token(self.member.id)
-        if not stored_token:
+        # Hand the username to the background verifier, the bio is checked without holding up this response
+        queued = await self.cog.bot.contributor_verifier.queue(self.member, github_username)
+        if not queued:
             embed = discord.Embed(
                 title="❌ Verification Expired",
                 description="Your verification token has expired. Please start over.",
@@ -60,103 +59,15 @@ class GitHubUsernameVerificationModal(discord.ui.Modal):
             await self.message.delete()
             return
 
-        # Verify token in GitHub bio
-        verification_result = await self.verify_github_token(github_username, stored_token)
-
-        if not verification_result['success']:
-            embed = discord.Embed(
-                title="❌ Verification Failed",
-                description=verification_result['message'],
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            await self.message.delete()
-            return
-
-        # Check if user is a contributor
-        is_contributor = await self.cog.bot.db.is_contributor(github_username)
-
-        if is_contributor:
-            # Give role
-            contributor_role = self.guild.get_role(CONTRIBUTOR_ROLE_ID)
-            if contributor_role:
-                try:
-                    await self.member.add_roles(contributor_role)
-                    # Clean up verification token
-                    await self.cog.bot.db.remove_verification_token(self.member.id)
-
-                    embed = discord.Embed(
-                        title="🎉 Welcome Contributor!",
-                        description=f"You have been granted the Contributor role!\n\n"
-                                   f"Verified GitHub account: **{github_username}**\n\n"
-                                   f"Thank you for your contributions to the project.",
-                        color=discord.Color.green()
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    await self.message.delete()
-                except discord.Forbidden:
-                    embed = discord.Embed(
-                        title="❌ Permission Error",
-                        description="I don't have permission to assign roles. Please contact an admin.",
-                        color=discord.Color.red()
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    await self.message.delete()
-            else:
-                embed = discord.Embed(
-                    title="❌ Configuration Error",
-                    description="Contributor role not found. Please contact an admin.",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                await self.message.delete()
-
-        else:
-            embed = discord.Embed(
-                title="❌ Not a Contributor",
-                description=f"GitHub account **{github_username}** was verified, but we couldn't find contributions to our repositories.\n\n"
-                           "If you've made recent contributions, please wait for the next sync (every 12 hours) "
-                           "or ask an admin to sync coolbot's database.",
-                color=discord.Color.orange()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            await self.message.delete()
-    async def verify_github_token(self, username: str, expected_token: str) -> dict:
-        """Verify that the token appears in the user's GitHub bio"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://api.github.com/users/{username}") as response:
-                    if response.status == 404:
-                        return {
-                            'success': False,
-                            'message': f"GitHub user '{username}' not found. Please check the username and try again."
-                        }
-                    elif response.status != 200:
-                        return {
-                            'success': False,
-                            'message': f"Failed to fetch GitHub profile for '{username}'. Please try again later."
-                        }
-
-                    user_data = await response.json()
-                    bio = user_data.get('bio', '') or ''
-
-                    if expected_token in bio:
-                        return {
-                            'success': True,
-                            'message': "GitHub account verified successfully!"
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'message': f"Verification token not found in {username}'s GitHub bio. "
-                                     f"Please make sure you've added the token exactly as shown and try again."
-                        }
-
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Error verifying GitHub account: {str(e)}. Please try again later."
-            }
+        embed = discord.Embed(
+            title="⏳ Verification Pending",
+            description=f"We'll keep checking **{github_username}**'s GitHub bio for your token for the next "
+                        f"{VERIFY_WINDOW_MINUTES} minutes and DM you as soon as it shows up.\n\n"
+                        "If you haven't added the token yet, you can do it now. There's no need to submit again.",
+            color=discord.Color.blue()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await self.message.delete()
 
 class ContributorRoleView(View):
     def __init__(self, cog):
@@ -194,8 +105,8 @@ class ContributorRoleView(View):
             # Generate verification token
             token = generate_verification_token()
 
-            # Store token in database
-            await self.cog.bot.db.create_verification_token(member.id, token, expires_in_minutes=5)
+            # Store token, it expires on its own after the verification window
+            await self.cog.bot.contributor_verifier.create_token(member.id, token)
 
             # Show verification instructions
             embed = discord.Embed(
@@ -206,11 +117,12 @@ class ContributorRoleView(View):
                            "**Step 2: Add token to your GitHub profile**\n"
                            "- Go to your [GitHub profile](https://github.com/settings/profile) and temporarily add the token above to your bio field.\n\n\n"
                            "**Step 3: Enter your GitHub username**\n"
-                           "- Once you've added the token to your bio, click the button below to enter your GitHub username.",
+                           "- Click the button below to enter your GitHub username, before or after adding the token. "
+                           "We'll check your bio in the background and DM you the result, so keep DMs from server members open.",
                 color=discord.Color.blue()
             )
 
-            embed.set_footer(text="Token expires in 5 minutes. You can remove it from your bio after verification.")
+            embed.set_footer(text=f"Token expires in {VERIFY_WINDOW_MINUTES} minutes. You can remove it from your bio after verification.")
 
             followup_msg = await interaction.followup.send(embed=embed, ephemeral=True, wait=True)
             view = GitHubUsernameVerificationView(self.cog, member, interaction.guild)
@@ -256,10 +168,10 @@ class ContributorRole(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            synced_count = await self.sync_contributors_from_github()
+            summary = await self.bot.contributors_sync.sync_contributors_from_github()  # type: ignore
             embed = discord.Embed(
                 title="Contributors Sync Complete",
-                description=f"✅ Successfully synced {synced_count} contributors from GitHub.",
+                description=f"✅ {format_summary(summary)}.",
                 color=discord.Color.green()
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
@@ -271,47 +183,6 @@ class ContributorRole(commands.Cog):
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
 
-    async def sync_contributors_from_github(self) -> int:
-        """Sync contributors from GitHub API for all configured repos"""
-        total_contributors = 0
-
-        async with aiohttp.ClientSession() as session:
-            for repo in REPOSITORIES:
-                if not repo.strip():
-                    continue
-
-                contributors = await self.fetch_repo_contributors(session, repo.strip())
-                for contributor in contributors:
-                    await self.bot.db.add_contributor(contributor['login'], repo)
-                    total_contributors += 1
-
-        return total_contributors
-
-    async def fetch_repo_contributors(self, session: aiohttp.ClientSession, repo: str) -> List[dict]:
-        """Fetch contributors for a specific repo from GitHub API"""
-        url = f"https://api.github.com/repos/{repo}/contributors"
-        contributors = []
-
-        page = 1
-        while True:
-            params = {'page': page, 'per_page': 100}
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    print(f"Error fetching contributors for {repo}: {response.status}")
-                    break
-
-                page_contributors = await response.json()
-                if not page_contributors:
-                    break
-
-                contributors.extend(page_contributors)
-                page += 1
-
-                # GitHub API rate limiting
-                await asyncio.sleep(0.1)
-
-        return contributors
-
 async def setup(bot: commands.Bot):
     cog = ContributorRole(bot)
     await bot.add_cog(cog)
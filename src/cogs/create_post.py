@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord.ui import View, button, Button
@@ -10,6 +11,8 @@ from config import (
     POST_CREATE_LOG_THREAD_ID,
 )
 
+logger = logging.getLogger(__name__)
+
 class ChannelSelectView(View):
     def __init__(self, cog, message, replied_message):
         super().__init__(timeout=60)
@@ -123,7 +126,7 @@ class CreatePost(commands.Cog):
             if thread_msg:
                 await self.send_support_embed(thread_msg)
                 await self.send_general_notification(replied_message, thread_msg)
-                await self.send_log(message, replied_message, content, files, thread_msg)
+                self.send_log(message, replied_message, content, files, thread_msg)
 
             # cleanup originals
             await self.delete_original_messages(msgs)
@@ -133,7 +136,7 @@ class CreatePost(commands.Cog):
                 pass
 
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
 
     async def get_messages_to_move(self, message, replied_message):
         msgs = [replied_message]
@@ -161,7 +164,7 @@ class CreatePost(commands.Cog):
                 try:
                     files.append(await att.to_file())
                 except discord.HTTPException:
-                    print(f"Failed to download: {att.filename}")
+                    logger.warning(f"Failed to download: {att.filename}", extra={"event": "attachment_failed", "guild_id": msg.guild.id if msg.guild else None})
         return files
 
     async def send_support_embed(self, thread_msg):
@@ -184,16 +187,14 @@ class CreatePost(commands.Cog):
           )
 
 
-    async def send_log(self, message, replied_message, content, files, thread_msg):
-        logs = self.bot.get_channel(POST_CREATE_LOG_THREAD_ID)
-        if logs:
-            log = discord.Embed(title="Post moved successfully.")
-            log.add_field(name="Owner", value=replied_message.author.mention, inline=False)
-            log.add_field(name="Moved by", value=message.author.mention, inline=False)
-            log.add_field(name="Characters", value=len(content), inline=False)
-            log.add_field(name="Attachments", value=f"{len(files)} files", inline=False)
-            log.add_field(name="Location", value=thread_msg.jump_url, inline=False)
-            await logs.send(embed=log)
+    def send_log(self, message, replied_message, content, files, thread_msg):
+        log = discord.Embed(title="Post moved successfully.")
+        log.add_field(name="Owner", value=replied_message.author.mention, inline=False)
+        log.add_field(name="Moved by", value=message.author.mention, inline=False)
+        log.add_field(name="Characters", value=len(content), inline=False)
+        log.add_field(name="Attachments", value=f"{len(files)} files", inline=False)
+        log.add_field(name="Location", value=thread_msg.jump_url, inline=False)
+        self.bot.log_sink.log(POST_CREATE_LOG_THREAD_ID, embed=log)
 
     async def delete_original_messages(self, messages):
         for m in messages:
@@ -202,11 +203,9 @@ class CreatePost(commands.Cog):
             except (discord.NotFound, discord.Forbidden):
                 pass
 
-    async def handle_error(self, error):
-        print(f"Error handling support request: {error}")
-        logs = self.bot.get_channel(POST_CREATE_LOG_THREAD_ID)
-        if logs:
-            await logs.send(embed=discord.Embed(description=str(error)))
+    def handle_error(self, error):
+        logger.error(f"Error handling support request: {error}", exc_info=error, extra={"event": "post_move_failed"})
+        self.bot.log_sink.log(POST_CREATE_LOG_THREAD_ID, embed=discord.Embed(description=str(error)))
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(CreatePost(bot))
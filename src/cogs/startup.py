@@ -13,14 +13,10 @@ class StartupCog(commands.Cog):
         await self.send_startup_log()
 
     async def send_startup_log(self):
-        thread = self.bot.get_channel(STARTUP_LOG_THREAD_ID)
-        if thread:
-            # Using datetime.now() to capture local time
-            timestamp = int(datetime.now().timestamp())
-            message = f"[ <t:{timestamp}:T> (<t:{timestamp}:R>) ] {self.bot.user.name} connected to Discord!"
-            await thread.send(message)
-        else:
-            print(f"Warning: Startup log thread with ID {STARTUP_LOG_THREAD_ID} not found.")
+        # Using datetime.now() to capture local time
+        timestamp = int(datetime.now().timestamp())
+        message = f"[ <t:{timestamp}:T> (<t:{timestamp}:R>) ] {self.bot.user.name} connected to Discord!"
+        self.bot.log_sink.log(STARTUP_LOG_THREAD_ID, message)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(StartupCog(bot))
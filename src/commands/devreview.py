@@ -2,6 +2,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import re
+import typing
 
 from config import (
     NEED_DEV_REVIEW_TAG_ID,
@@ -11,6 +13,7 @@ from config import (
     CLOUD_SUPPORT_ALERT_ROLE_ID,
     CORE_DEVELOPER_SUPPORT_ALERT_ROLE_ID
 )
+from commands.solved import thread_from_match
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +98,7 @@ async def process_immediate_alert(post: discord.Thread, staff: discord.Member, b
     embed.set_footer(text=f"Invoked by {staff.display_name}")
 
     try:
-        view = AlertView(bot)
+        view = AlertView(bot, post)
         sent_msg = await team_channel.send(content=f"Hey <@&{alert_role_id}> a support post needs your attention!", embed=embed, view=view)
         # Save the alert view to database
         try:
@@ -201,35 +204,72 @@ class UserSelectView(discord.ui.View):
             pass
         self.stop()
 
-class SubmitInfoView(discord.ui.View):
+class SubmitInfoButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"submit_info_button(?::(?P<thread_id>[0-9]+):(?P<target_id>[0-9]+):(?P<staff_id>[0-9]+))?"
+):
     """
-    A view with a button labeled "Submit information" that, when clicked by the designated user,
+    A button labeled "Submit information" that, when clicked by the designated user,
     shows a modal for them to enter additional details.
     """
-    def __init__(self, post: discord.Thread, target_user: discord.Member, staff: discord.Member, bot: commands.Bot, message_to_delete: discord.Message):
-        super().__init__(timeout=None) 
+    def __init__(self, post: discord.Thread, target_id: int, staff: discord.Member, bot: commands.Bot):
+        super().__init__(
+            discord.ui.Button(
+                label="Submit Information",
+                style=discord.ButtonStyle.primary,
+                custom_id=f"submit_info_button:{post.id}:{target_id}:{staff.id}"
+            )
+        )
         self.post = post
-        self.target_user = target_user
+        self.target_id = target_id
         self.staff = staff
         self.bot = bot
-        self.message_to_delete = message_to_delete
 
-    @discord.ui.button(
-        label="Submit Information", 
-        style=discord.ButtonStyle.primary,
-        custom_id="submit_info_button" 
-    )
-    async def submit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.target_user.id:
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match):
+        post = await thread_from_match(interaction, match)
+        staff = None
+        if match["target_id"]:
+            target_id = int(match["target_id"])
+            staff_id = int(match["staff_id"])
+            staff = post.guild.get_member(staff_id)
+            if staff is None:
+                try:
+                    staff = await post.guild.fetch_member(staff_id)
+                except discord.NotFound:
+                    staff = None
+        else:
+            # Sent before the IDs were encoded, the stored view metadata only knows the target user
+            view_data = await interaction.client.db.get_view(interaction.message.id)
+            if view_data is None:
+                raise ValueError(f"No stored submit info view for message {interaction.message.id}")
+            target_id = view_data['post_owner_id']
+        return cls(post, target_id, staff or post.guild.me, interaction.client)
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id != self.target_id:
             error_embed = discord.Embed(description="This option is unavailable to you. Only the staff-picked member can use it.", color=discord.Color.red())
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
             return
         try:
-            modal = RequestMoreInfoModal(self.post, self.staff, self.bot, self.message_to_delete)
+            modal = RequestMoreInfoModal(self.post, self.staff, self.bot, interaction.message)
             await interaction.response.send_modal(modal)
         except Exception as e:
             pass
 
+class SubmitInfoView(discord.ui.View):
+    """
+    A view with the "Submit information" button for the staff-picked member.
+    """
+    def __init__(self, post: discord.Thread, target_user: discord.Member, staff: discord.Member, bot: commands.Bot, message_to_delete: discord.Message):
+        super().__init__(timeout=None) 
+        self.post = post
+        self.target_user = target_user
+        self.staff = staff
+        self.bot = bot
+        self.message_to_delete = message_to_delete
+        self.add_item(SubmitInfoButton(post, target_user.id, staff, bot))
+
 class RequestMoreInfoModal(discord.ui.Modal, title="coolLabs Support"):
     """
     A modal presented to the selected user to collect additional information.
@@ -318,20 +358,27 @@ class RequestMoreInfoModal(discord.ui.Modal, title="coolLabs Support"):
             pass
 
 
-class AlertView(discord.ui.View):
+class AlertSolvedButton(discord.ui.DynamicItem[discord.ui.Button], template=r"mark_solved(?::(?P<thread_id>[0-9]+))?"):
     """
-    A view for the alert message sent to the channel, with a button to mark as solved.
+    The "Mark as solved?" button on alert messages sent to the team channel.
     """
-    def __init__(self, bot: commands.Bot):
-        super().__init__(timeout=None)
+    def __init__(self, bot: commands.Bot, thread_id: typing.Optional[int] = None):
+        super().__init__(
+            discord.ui.Button(
+                label="Mark as solved?",
+                style=discord.ButtonStyle.success,
+                custom_id=f"mark_solved:{thread_id}" if thread_id else "mark_solved"
+            )
+        )
         self.bot = bot
+        self.thread_id = thread_id
 
-    @discord.ui.button(
-        label="Mark as solved?",
-        style=discord.ButtonStyle.success,
-        custom_id="mark_solved"
-    )
-    async def mark_solved_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match):
+        thread_id = int(match["thread_id"]) if match["thread_id"] else None
+        return cls(interaction.client, thread_id)
+
+    async def callback(self, interaction: discord.Interaction):
         try:
             embed = interaction.message.embeds[0]
             embed.color = discord.Color.green()
@@ -340,6 +387,15 @@ class AlertView(discord.ui.View):
         except Exception as e:
             pass
 
+class AlertView(discord.ui.View):
+    """
+    A view for the alert message sent to the channel, with a button to mark as solved.
+    """
+    def __init__(self, bot: commands.Bot, post: typing.Optional[discord.Thread] = None):
+        super().__init__(timeout=None)
+        self.bot = bot
+        self.add_item(AlertSolvedButton(bot, post.id if post else None))
+
 class MarkReviewView(discord.ui.View):
     """
     A view with two buttons:
@@ -0,0 +1,60 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+from config import AUTHORIZED_ROLE_ID, COOLBOT_ADMIN_ROLE_ID
+
+class Diagnostics(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(title="Diagnostics", color=discord.Color.blue(), timestamp=discord.utils.utcnow())
+
+        http_client = self.bot.http_client  # type: ignore
+        connector = http_client.session.connector if http_client.session else None
+        if connector is not None:
+            embed.add_field(
+                name="HTTP Pool",
+                value=f"```limit {connector.limit} | per host {connector.limit_per_host}```",
+                inline=False
+            )
+        for host, stats in sorted(http_client.stats.items(), key=lambda item: -item[1].get("requests", 0))[:10]:
+            counters = " | ".join(f"{key} {value}" for key, value in sorted(stats.items()))
+            embed.add_field(name=host, value=f"```{counters}```", inline=False)
+
+        github = self.bot.github  # type: ignore
+        quota = f"{github.remaining}/{github.limit}, resets <t:{int(github.reset_at)}:R>" if github.limit else "unknown yet"
+        embed.add_field(
+            name="GitHub API",
+            value=f"Quota: {quota}\n```requests {github.requests} | retries {github.retries}```",
+            inline=False
+        )
+        embed.add_field(
+            name="GitHub Profile Cache",
+            value=(
+                f"```cached {len(github.profiles)} | revalidated (304) {github.profile_stats['revalidated']}"
+                f" | fetched {github.profile_stats['fetched']}```"
+            ),
+            inline=False
+        )
+
+        log_sink = self.bot.log_sink  # type: ignore
+        embed.add_field(
+            name="Log Sink",
+            value=(
+                f"```entries {log_sink.stats['entries']} | messages {log_sink.stats['messages']}"
+                f" | dropped {log_sink.stats['dropped']} | budget {log_sink.budget}/min```"
+            ),
+            inline=False
+        )
+        return embed
+
+    @app_commands.command(name="diagnostics", description="Show outbound HTTP and GitHub API statistics")
+    @app_commands.guild_only()
+    @app_commands.checks.has_any_role(AUTHORIZED_ROLE_ID, COOLBOT_ADMIN_ROLE_ID)
+    async def diagnostics(self, interaction: discord.Interaction):
+        await interaction.response.send_message(embed=self.build_embed(), ephemeral=True)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Diagnostics(bot))
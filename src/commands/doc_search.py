@@ -7,9 +7,34 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Ranked results past the first few are rarely what was meant, keep the reply short
+DOC_SEARCH_LIMIT = 5
+
+async def find_docs(bot: commands.Bot, query: str, limit: int) -> list:
+    """
+    Full-text matches over names, aliases and keywords first, then the in-memory
+    fuzzy ranking (which tolerates typos) fills up the remaining slots.
+    """
+    if not query.strip():
+        return bot.doc_index.rank(query, limit=limit)  # type: ignore
+    results = []
+    try:
+        results = [dict(row) for row in await bot.db.search_doc_entries(query, limit) or []]  # type: ignore
+    except Exception as e:
+        logger.error(f"Doc full-text search failed: {e}")
+    if len(results) < limit:
+        seen = {entry['name'] for entry in results}
+        for entry in bot.doc_index.rank(query, limit=limit):  # type: ignore
+            if entry['name'] not in seen:
+                results.append(entry)
+                if len(results) == limit:
+                    break
+    return results
+
 async def autocomplete_doc_search(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-    docs = await interaction.client.db.get_doc_entries()  # type: ignore
-    return [app_commands.Choice(name=doc['name'], value=doc['name']) for doc in docs if current.lower() in doc['name'].lower()][:25]
+    # Runs on every keystroke, so only the in-memory index (which covers aliases and keywords too)
+    docs = interaction.client.doc_index.rank(current, limit=25)  # type: ignore
+    return [app_commands.Choice(name=doc['name'], value=doc['name']) for doc in docs]
 
 class DocUserPickerView(discord.ui.View):
     """
@@ -134,11 +159,9 @@ class DocSearch(commands.Cog):
     @app_commands.guild_only()
     @app_commands.autocomplete(query=autocomplete_doc_search)
     async def doc_search(self, interaction: discord.Interaction, query: str):
-        docs = await self.bot.db.get_doc_entries()  # type: ignore
-        results = []
-        for entry in docs:
-            if query.lower() in entry['name'].lower():
-                results.append(entry)
+        # Picking an autocomplete choice sends its exact name, which should only send that doc
+        exact = self.bot.doc_index.find_exact(query)  # type: ignore
+        results = [exact] if exact else await find_docs(self.bot, query, DOC_SEARCH_LIMIT)
 
         if not results:
             await interaction.response.send_message("No matching documents found.", ephemeral=True)
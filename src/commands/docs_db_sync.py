@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-
-COOLBOT_JSON_URL = "https://next.coolify.io/docs/coolbot.json"
+from tasks.docs_sync import format_diff
 
 class DocsDBSync(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -13,7 +12,9 @@ class DocsDBSync(commands.Cog):
     async def docs_db_sync(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         try:
-            updated, status_info = await self.bot.db.sync_docs_from_url(COOLBOT_JSON_URL)  # type: ignore
+            docs_sync = self.bot.docs_sync  # type: ignore
+            joined = docs_sync.running
+            updated, status_info = await docs_sync.sync()
 
             # Create embed with sync information
             embed = discord.Embed(
@@ -27,31 +28,42 @@ class DocsDBSync(commands.Cog):
             description_parts.append(f"**Remote URL:**\n```{status_info['url']}```")
 
             # Request Headers (2nd)
-            header_status = "Used" if status_info['used_etag_header'] else "Not used"
+            header_status = "Used" if status_info.get('used_etag_header') else "Not used"
             description_parts.append(f"**Request Headers:**\n```If-None-Match: {header_status}```")
 
             # Response Status (3rd)
-            description_parts.append(f"**Response Status:**\n```HTTP {status_info['response_status']}```")
+            description_parts.append(f"**Response Status:**\n```HTTP {status_info.get('response_status')}```")
 
             # Current ETag (4th)
-            if status_info["current_etag"]:
+            if status_info.get("current_etag"):
                 description_parts.append(f"**Current ETag:**\n```{status_info['current_etag']}```")
             else:
                 description_parts.append("**Current ETag:**\n```None (first sync)```")
 
             # Response ETag (5th)
-            if status_info["response_etag"]:
+            if status_info.get("response_etag"):
                 description_parts.append(f"**Response ETag:**\n```{status_info['response_etag']}```")
 
             # Sync Status (6th)
-            if status_info["error"]:
+            if status_info.get("error"):
                 description_parts.append(f"**Sync Status:**\n```Error: {status_info['error']}```")
                 embed.color = discord.Color.red()
             elif updated:
-                description_parts.append(f"**Sync Status:**\n```Database updated with {status_info['docs_count']} documentation entries```")
+                description_parts.append(f"**Sync Status:**\n```Database updated, now {status_info['docs_count']} documentation entries```")
+                description_parts.append(f"**Changes:**\n```diff\n{format_diff(status_info['diff'])}```")
+            elif status_info.get("diff") is not None:
+                description_parts.append("**Sync Status:**\n```New ETag, but no entries changed```")
             else:
                 description_parts.append("**Sync Status:**\n```No updates needed (ETag match)```")
 
+            # Sync Run (7th)
+            run = "Joined the sync already in progress" if joined else "Started a new sync"
+            description_parts.append(f"**Sync Run:**\n```{run}```")
+            if docs_sync.failures:
+                description_parts.append(f"**Consecutive Failures:**\n```{docs_sync.failures}```")
+            if docs_sync.next_sync_at:
+                description_parts.append(f"**Next Automatic Sync:**\n<t:{docs_sync.next_sync_at}:R>")
+
             embed.description = "\n\n".join(description_parts)
 
             await interaction.followup.send(embed=embed, ephemeral=True)
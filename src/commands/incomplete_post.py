@@ -1,9 +1,10 @@
+import logging
 import discord
-from discord import app_commands, ui
+from discord import app_commands
 from discord.ext import commands
-import asyncio
 from datetime import datetime, timedelta, timezone
 from utils.database import Database
+from tasks.post_closer import resolve_thread
 from config import (
     SUPPORT_CHANNEL_ID,
     SOLVED_TAG_ID,
@@ -11,60 +12,47 @@ from config import (
     AUTHORIZED_ROLE_ID
 )
 
-class IncompletePostView(ui.View):
-    """Persistent view for incomplete-post notifications."""
-    def __init__(self, bot: commands.Bot, thread: discord.Thread, owner_id: int, message_id: int):
-        super().__init__(timeout=None)
-        self.bot = bot
-        self.thread = thread
-        self.owner_id = owner_id
-        self.message_id = message_id
-        self.timer_task = None
+logger = logging.getLogger(__name__)
 
-    async def start_timer(self, delay: float = 12 * 3600):
-        """Start the auto-close timer and record delay in pending_closes."""
-        await self.bot.db.add_close_task(self.thread.id, int(delay))
-        # Schedule auto-close
-        self.timer_task = asyncio.create_task(self._auto_close(delay))
+class IncompletePost(commands.Cog):
+    """Cog implementing the /incomplete-post command, with persistent DB backing."""
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        bot.scheduler.register("incomplete_close", self.auto_close)
 
-    async def _auto_close(self, delay: float):
-        await asyncio.sleep(delay)
-        try:
-            parent = self.thread.parent
-            solved_tag = parent.get_tag(SOLVED_TAG_ID)
-            coolify = parent.get_tag(COOLIFY_CLOUD_TAG_ID)
-            new_tags = []
-            if solved_tag:
-                new_tags.append(solved_tag)
-            if coolify and coolify in self.thread.applied_tags:
-                new_tags.append(coolify)
-            # Lock first
-            await self.thread.edit(locked=True)
-            # Send closure message before archiving (to avoid auto-unarchive)
-            await self.thread.send(
-                embed=discord.Embed(
-                    title="Post automatically closed",
-                    description="No response from the post owner, so marking this as solved.",
-                    color=discord.Color.green()
-                )
+    async def auto_close(self, job):
+        """Close the post when the owner never provided the requested details"""
+        thread = await resolve_thread(self.bot, job.payload["thread_id"])
+        if thread is None or thread.locked:
+            return
+        parent = thread.parent
+        solved_tag = parent.get_tag(SOLVED_TAG_ID)
+        coolify = parent.get_tag(COOLIFY_CLOUD_TAG_ID)
+        new_tags = []
+        if solved_tag:
+            new_tags.append(solved_tag)
+        if coolify and coolify in thread.applied_tags:
+            new_tags.append(coolify)
+        # Lock first
+        await thread.edit(locked=True)
+        # Send closure message before archiving (to avoid auto-unarchive)
+        await thread.send(
+            embed=discord.Embed(
+                title="Post automatically closed",
+                description="No response from the post owner, so marking this as solved.",
+                color=discord.Color.green()
             )
-            # Archive and apply solved tag
-            await self.thread.edit(applied_tags=new_tags, archived=True)
-            # Cleanup DB
-            await self.bot.db.remove_view(self.message_id)
-            await self.bot.db.remove_close_task(self.thread.id)
-        except Exception as e:
-            print(f"Error auto-closing incomplete-post: {e}")
-        finally:
-            self.bot.incomplete_views.pop(self.thread.id, None)
+        )
+        # Archive and apply solved tag
+        await thread.edit(applied_tags=new_tags, archived=True)
+        # Cleanup DB
+        await self.bot.db.remove_view(job.payload["message_id"])
 
-    async def handle_response(self):
+    async def handle_response(self, thread: discord.Thread, message_id: int):
         """Handle post-owner’s reply: cancel close and thank them."""
-        if self.timer_task and not self.timer_task.done():
-            self.timer_task.cancel()
-        await self.bot.db.remove_close_task(self.thread.id)
+        await self.bot.scheduler.cancel("incomplete_close", thread.id)
         try:
-            msg = await self.thread.fetch_message(self.message_id)
+            msg = await thread.fetch_message(message_id)
             embed = msg.embeds[0]
             embed.title = f"~~{embed.title}~~"
             embed.description = (
@@ -72,17 +60,9 @@ class IncompletePostView(ui.View):
                 "Thanks for providing the details! Your post will not be closed automatically."
             )
             await msg.edit(content=None, embed=embed, view=None)
-            await self.bot.db.mark_view_solved(self.message_id, True)
-        except Exception as e:
-            print(f"Error handling response for incomplete-post: {e}")
-        finally:
-            self.bot.incomplete_views.pop(self.thread.id, None)
-
-class IncompletePost(commands.Cog):
-    """Cog implementing the /incomplete-post command, with persistent DB backing."""
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        bot.incomplete_views = {}
+            await self.bot.db.mark_view_solved(message_id, True)
+        except Exception:
+            logger.exception("Error handling response for incomplete-post", extra={"event": "incomplete_response_failed", "guild_id": thread.guild.id, "thread_id": thread.id})
 
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
@@ -133,13 +113,12 @@ class IncompletePost(commands.Cog):
             content=f"Hey <@{owner_id}>!",
             embed=embed
         )
-        view = IncompletePostView(self.bot, thread, owner_id, sent.id)
-        try:
-            await sent.edit(view=view)
-        except (discord.NotFound, AttributeError):
-            # Message might have been deleted, continue anyway
-            pass
-        await view.start_timer(delay_seconds)
+        await self.bot.scheduler.schedule(
+            "incomplete_close",
+            thread.id,
+            delay_seconds,
+            {"thread_id": thread.id, "message_id": sent.id, "owner_id": owner_id}
+        )
 
         await self.bot.db.add_view(
             message_id=sent.id,
@@ -149,15 +128,14 @@ class IncompletePost(commands.Cog):
             post_owner_id=owner_id,
             is_solved=False
         )
-        self.bot.incomplete_views[thread.id] = view
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.bot or not isinstance(message.channel, discord.Thread):
             return
-        view = self.bot.incomplete_views.get(message.channel.id)
-        if view and message.author.id == view.owner_id:
-            await view.handle_response()
+        job = self.bot.scheduler.get("incomplete_close", message.channel.id)
+        if job and message.author.id == job.payload["owner_id"]:
+            await self.handle_response(message.channel, job.payload["message_id"])
 
 async def setup(bot: commands.Bot):
     if not hasattr(bot, 'db'):
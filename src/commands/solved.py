@@ -1,8 +1,7 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, ui
-import asyncio
-import datetime
+import re
 
 from config import (
     SOLVED_TAG_ID,
@@ -13,13 +12,11 @@ from config import (
     COMMUNITY_SUPPORT_CHANNEL_ID,
     COMMUNITY_SOLVED_TAG_ID,
 )
+from tasks.post_closer import resolve_thread
 
 async def process_solved_thread(thread: discord.Thread, bot: commands.Bot):
     """Common logic for marking a thread as solved"""
-    await bot.post_closer.schedule_close(thread)
-    now = datetime.datetime.now(datetime.timezone.utc)
-    one_hour = now + datetime.timedelta(hours=1)
-    return round(one_hour.timestamp())
+    return await bot.post_closer.schedule_close(thread)
 
 async def is_user_authorized(thread: discord.Thread, user: discord.User) -> bool:
     """
@@ -121,16 +118,34 @@ class CommunityNotSolvedButton(ui.Button):
         view.add_item(CommunitySolvedButton(self.bot, self.thread))
         await interaction.response.edit_message(embed=embed, view=view)
 
-class NotSolvedButton(ui.Button):
+async def thread_from_match(interaction: discord.Interaction, match: re.Match) -> discord.Thread:
+    """
+    Resolve the thread encoded in a dynamic button's custom_id. Buttons sent before
+    the thread ID was encoded only carry the bare prefix, those live in the thread itself.
+    """
+    thread_id = int(match["thread_id"]) if match["thread_id"] else interaction.channel_id
+    if isinstance(interaction.channel, discord.Thread) and interaction.channel.id == thread_id:
+        return interaction.channel
+    thread = await resolve_thread(interaction.client, thread_id)
+    if thread is None:
+        raise ValueError(f"Thread {thread_id} not found")
+    return thread
+
+class NotSolvedButton(ui.DynamicItem[ui.Button], template=r"not_solved_button(?::(?P<thread_id>[0-9]+))?"):
     def __init__(self, bot: commands.Bot, thread: discord.Thread):
         super().__init__(
-            label="Mark as Not Solved",
-            style=discord.ButtonStyle.grey,
-            custom_id="not_solved_button"
+            ui.Button(
+                label="Mark as Not Solved",
+                style=discord.ButtonStyle.grey,
+                custom_id=f"not_solved_button:{thread.id}"
+            )
         )
         self.bot = bot
         self.thread = thread
-        self.message = None
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match: re.Match):
+        return cls(interaction.client, await thread_from_match(interaction, match))
 
     async def callback(self, interaction: discord.Interaction):
         try:
@@ -187,16 +202,22 @@ class NotSolvedButton(ui.Button):
         except Exception as e:
             await interaction.followup.send("An error occurred while processing your request.", ephemeral=True)
 
-class SolvedButton(ui.Button):
+class SolvedButton(ui.DynamicItem[ui.Button], template=r"solved_button(?::(?P<thread_id>[0-9]+))?"):
     def __init__(self, bot: commands.Bot, thread: discord.Thread):
         super().__init__(
-            label="Mark as Solved",
-            style=discord.ButtonStyle.green,
-            custom_id="solved_button"
+            ui.Button(
+                label="Mark as Solved",
+                style=discord.ButtonStyle.green,
+                custom_id=f"solved_button:{thread.id}"
+            )
         )
         self.bot = bot
         self.thread = thread
 
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match: re.Match):
+        return cls(interaction.client, await thread_from_match(interaction, match))
+
     async def callback(self, interaction: discord.Interaction):
         try:
             await interaction.response.defer()
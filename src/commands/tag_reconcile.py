@@ -0,0 +1,30 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+from config import AUTHORIZED_ROLE_ID, COOLBOT_ADMIN_ROLE_ID
+from tasks.tag_reconciler import build_summary_embed
+
+class TagReconcile(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="tags-reconcile", description="Recompute the tags of active support posts")
+    @app_commands.guild_only()
+    @app_commands.checks.has_any_role(AUTHORIZED_ROLE_ID, COOLBOT_ADMIN_ROLE_ID)
+    @app_commands.describe(dry_run="Only report the corrections without applying them")
+    async def tags_reconcile(self, interaction: discord.Interaction, dry_run: bool = True):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            summary = await self.bot.tag_reconciler.reconcile(dry_run=dry_run)  # type: ignore
+            await interaction.followup.send(embed=build_summary_embed(summary), ephemeral=True)
+        except Exception as e:
+            embed = discord.Embed(
+                title="Tag Reconciliation Failed",
+                description=f"An error occurred during reconciliation: {e}",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(TagReconcile(bot))
@@ -20,6 +20,14 @@ NEED_DEV_REVIEW_TAG_ID = int(os.getenv('NEED_DEV_REVIEW_TAG_ID'))
 UNANSWERED_TAG_ID = int(os.getenv('UNANSWERED_TAG_ID'))
 WAITING_FOR_REPLY_TAG_ID = int(os.getenv('WAITING_FOR_REPLY_TAG_ID'))
 
+# Tag reconciliation sweep over active support posts
+TAG_RECONCILE_INTERVAL_HOURS = int(os.getenv('TAG_RECONCILE_INTERVAL_HOURS') or '6')
+TAG_RECONCILE_DRY_RUN = (os.getenv('TAG_RECONCILE_DRY_RUN') or 'false').lower() == 'true'
+
+# Doc links suggested on new support posts
+DOC_SUGGEST_THRESHOLD = float(os.getenv('DOC_SUGGEST_THRESHOLD') or '0.3')
+DOC_SUGGEST_LIMIT = int(os.getenv('DOC_SUGGEST_LIMIT') or '3')
+
 COMMUNITY_SUPPORT_CHANNEL_ID = int(os.getenv('COMMUNITY_SUPPORT_CHANNEL_ID'))
 COMMUNITY_SOLVED_TAG_ID = int(os.getenv('COMMUNITY_SOLVED_TAG_ID'))
 PRIVATE_DATA_CHANNEL_ID = int(os.getenv('PRIVATE_DATA_CHANNEL_ID'))
@@ -34,6 +42,14 @@ REPORTS_PING_ROLE_ID = int(os.getenv('REPORTS_PING_ROLE_ID'))
 # Page actions logging
 PAGE_ACTIONS_THREAD_ID = int(os.getenv('PAGE_ACTIONS_THREAD_ID'))
 
+# Messages per minute each log thread may receive, log entries are packed into them and dropped beyond
+LOG_BUDGET_PER_MINUTE = int(os.getenv('LOG_BUDGET_PER_MINUTE') or '20')
+
+# Log level of the bot, and per-logger overrides as comma separated logger=LEVEL pairs
+# (loggers are module paths like tasks.docs_sync or commands.page, plus discord for the library)
+LOG_LEVEL = os.getenv('LOG_LEVEL') or 'INFO'
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+
 # Page response webhook
 PAGE_RESPONSE_WEBHOOK_URL = os.getenv('PAGE_RESPONSE_WEBHOOK_URL')
 
@@ -41,10 +57,21 @@ PAGE_RESPONSE_WEBHOOK_URL = os.getenv('PAGE_RESPONSE_WEBHOOK_URL')
 NTFY_TOPIC_NAME = os.getenv('NTFY_TOPIC_NAME')
 NTFY_SECOND_TOPIC = os.getenv('NTFY_SECOND_TOPIC')
 
+# Critical pages nobody acknowledged within PAGE_ESCALATION_MINUTES are sent again to this topic (default: NTFY_TOPIC_NAME)
+NTFY_ESCALATION_TOPIC = os.getenv('NTFY_ESCALATION_TOPIC')
+PAGE_ESCALATION_MINUTES = int(os.getenv('PAGE_ESCALATION_MINUTES') or '15')
+
 # Contributor role configuration
 CONTRIBUTORS_CHANNEL_ID = int(os.getenv('CONTRIBUTORS_CHANNEL_ID'))
 CONTRIBUTOR_ROLE_ID = int(os.getenv('CONTRIBUTOR_ROLE_ID'))
 
+# Optional GitHub token, raises the API rate limit from 60 to 5000 requests per hour
+GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+
+# "repositories" syncs the REPOSITORIES below, "org" discovers every public repo of GITHUB_ORG
+CONTRIBUTORS_SYNC_MODE = (os.getenv('CONTRIBUTORS_SYNC_MODE') or 'repositories').lower()
+GITHUB_ORG = os.getenv('GITHUB_ORG') or 'coollabsio'
+
 # Repository configuration - repos under organization
 # Format: orgname/reponame
 REPOSITORIES = [
@@ -1,25 +1,49 @@
 import discord
 from discord.ext import commands
 import asyncio
+import logging
 from pathlib import Path
 import sys
 import os
 
-from config import TOKEN
+from config import TOKEN, GITHUB_TOKEN, LOG_BUDGET_PER_MINUTE, LOG_LEVEL, LOG_LEVELS
 # Ensure the src directory is on the Python path
 sys.path.append(str(Path(__file__).parent))
 
 from utils.database import Database
+from tasks.scheduler import Scheduler
 from tasks.post_closer import PostCloser
 from tasks.docs_sync import DocsSync
 from tasks.contributors_sync import ContributorsSync
+from tasks.contributor_verifier import ContributorVerifier
+from tasks.tag_reconciler import TagReconciler
+from tasks.page_acks import PageAcks
+from tasks.page_delivery import PageDelivery
 from utils.view_loader import load_persistent_views
+from utils.doc_index import DocIndex
+from utils.doc_suggester import DocSuggester
+from utils.github import GitHubClient
+from utils.http import HttpClient
+from utils.log_sink import LogSink
+from utils.logging_setup import setup_logging
+
+logger = logging.getLogger("main")
 
 intents = discord.Intents.all()
 bot = commands.Bot(command_prefix="c!", intents=intents)
+bot.http_client = HttpClient()
+bot.log_sink = LogSink(bot, LOG_BUDGET_PER_MINUTE)
+bot.github = GitHubClient(bot.http_client, GITHUB_TOKEN)
+bot.scheduler = Scheduler(bot)
 bot.post_closer = PostCloser(bot)
+bot.doc_index = DocIndex()
+bot.doc_suggester = DocSuggester()
 bot.docs_sync = DocsSync(bot)
 bot.contributors_sync = ContributorsSync(bot)
+bot.contributor_verifier = ContributorVerifier(bot)
+bot.tag_reconciler = TagReconciler(bot)
+bot.page_acks = PageAcks(bot)
+bot.page_delivery = PageDelivery(bot)
 
 async def load_extensions(bot: commands.Bot):
     base_path = Path(__file__).parent.absolute()
@@ -27,7 +51,7 @@ async def load_extensions(bot: commands.Bot):
     for directory in directories:
         path = base_path / directory
         if not path.exists():
-            print(f"Warning: Directory {path} does not exist")
+            logger.warning(f"Directory {path} does not exist")
             continue
         sys.path.append(str(base_path))
         for ext in path.glob("*.py"):
@@ -36,22 +60,22 @@ async def load_extensions(bot: commands.Bot):
             relative_path = ext.relative_to(base_path)
             module_name = str(relative_path).replace(os.sep, ".")[:-3]  # Remove .py
             if module_name in bot.extensions:
-                print(f"Skipping already loaded extension: {module_name}")
+                logger.debug(f"Skipping already loaded extension: {module_name}")
                 continue
             try:
                 await bot.load_extension(module_name)
-                print(f"Loaded extension: {module_name}")
-            except Exception as e:
-                print(f"Failed to load extension {module_name}: {type(e).__name__}: {e}")
+                logger.info(f"Loaded extension: {module_name}", extra={"event": "extension_loaded"})
+            except Exception:
+                logger.exception(f"Failed to load extension {module_name}", extra={"event": "extension_failed"})
 
 async def setup_database(bot):
     bot.db = Database()
     await bot.db.init()
-    print("Database initialized")
+    logger.info("Database initialized", extra={"event": "database_ready"})
 
 @bot.event
 async def on_connect():
-    print("Bot connected to Discord (on_connect event)")
+    logger.info("Bot connected to Discord (on_connect event)", extra={"event": "connected"})
 
 @bot.event
 async def on_ready():
@@ -59,40 +83,61 @@ async def on_ready():
     if getattr(bot, "ready", False):
         return
     bot.ready = True
-    print("Bot is ready, executing on_ready tasks...")
+    logger.info("Bot is ready, executing on_ready tasks...", extra={"event": "ready"})
+    try:
+        # Before the scheduler, its restored poll job needs the verification tokens in place
+        await bot.contributor_verifier.initialize_tasks()
+    except Exception:
+        logger.exception("Error initializing contributor_verifier tasks", extra={"event": "init_failed"})
     try:
-        await bot.post_closer.initialize_tasks()
-    except Exception as e:
-        print(f"Error initializing post_closer tasks: {e}")
+        await bot.scheduler.initialize_tasks()
+    except Exception:
+        logger.exception("Error initializing scheduler tasks", extra={"event": "init_failed"})
     try:
         await bot.docs_sync.initialize_tasks()
-    except Exception as e:
-        print(f"Error initializing docs_sync tasks: {e}")
+    except Exception:
+        logger.exception("Error initializing docs_sync tasks", extra={"event": "init_failed"})
     try:
         await bot.contributors_sync.initialize_tasks()
-    except Exception as e:
-        print(f"Error initializing contributors_sync tasks: {e}")
+    except Exception:
+        logger.exception("Error initializing contributors_sync tasks", extra={"event": "init_failed"})
+    try:
+        await bot.tag_reconciler.initialize_tasks()
+    except Exception:
+        logger.exception("Error initializing tag_reconciler tasks", extra={"event": "init_failed"})
     try:
-        await load_persistent_views(bot)
-    except Exception as e:
-        print(f"Error loading persistent views: {e}")
+        # Before page_acks, acknowledgements replayed on its first connect need their waiters in place
+        await bot.page_delivery.initialize_tasks()
+    except Exception:
+        logger.exception("Error initializing page_delivery tasks", extra={"event": "init_failed"})
+    try:
+        await bot.page_acks.initialize_tasks()
+    except Exception:
+        logger.exception("Error initializing page_acks tasks", extra={"event": "init_failed"})
     try:
         synced_commands = await bot.tree.sync()
-        print(f"Successfully synced {len(synced_commands)} commands")
-    except Exception as e:
-        print(f"Error syncing commands: {e}")
+        logger.info(f"Successfully synced {len(synced_commands)} commands", extra={"event": "commands_synced"})
+    except Exception:
+        logger.exception("Error syncing commands", extra={"event": "commands_sync_failed"})
     try:
         await asyncio.sleep(1)  # slight delay to avoid race conditions
         await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name="coolLabs"))
-        print(f"{bot.user} has connected to Discord!")
-    except Exception as e:
-        print(f"Error setting presence: {e}")
+        logger.info(f"{bot.user} has connected to Discord!", extra={"event": "presence_set"})
+    except Exception:
+        logger.exception("Error setting presence", extra={"event": "presence_failed"})
 
 async def main():
     await setup_database(bot)
-    async with bot:
-        await load_extensions(bot)
-        await bot.start(TOKEN)
+    await bot.http_client.start()
+    bot.github.start()
+    try:
+        async with bot:
+            await load_extensions(bot)
+            await load_persistent_views(bot)
+            await bot.start(TOKEN)
+    finally:
+        await bot.http_client.close()
 
 if __name__ == "__main__":
+    setup_logging(LOG_LEVEL, LOG_LEVELS)
     asyncio.run(main())
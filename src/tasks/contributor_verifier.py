@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+import discord
+from typing import Optional
+
+from config import CONTRIBUTOR_ROLE_ID
+from utils.github import GitHubRateLimited
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Minutes a user has to get the token into their bio once they entered their username
+VERIFY_WINDOW_MINUTES = 30
+
+# Pending verifications are checked every POLL_INTERVAL seconds, at most BATCH_SIZE per round
+FIRST_POLL_DELAY = 5
+POLL_INTERVAL = 30
+BATCH_SIZE = 20
+
+# A round may queue behind the GitHub rate limit for this long, otherwise it waits for the reset
+POLL_MAX_WAIT = 30
+
+class ContributorVerifier:
+    """
+    Verifies contributors in the background. Users enter their GitHub username once, their bios are
+    then polled in batches on the scheduler until the token shows up or the window runs out, and the
+    outcome is sent by DM. No interaction ever waits on GitHub.
+
+    Active tokens live in a TTL cache, written through to the database only to survive restarts.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.tokens = TTLCache(on_expire=self.expire)  # user_id -> verification dict
+        bot.scheduler.register("contributor_verify", self.poll)
+
+    async def initialize_tasks(self):
+        """Restore tokens from before the restart, the ones that expired meanwhile expire right away"""
+        for row in await self.bot.db.get_verification_tokens():
+            self.tokens.set(row["user_id"], {
+                "user_id": row["user_id"],
+                "verification_token": row["verification_token"],
+                "github_login": row["github_login"],
+                "guild_id": row["guild_id"],
+                "last_checked_at": 0
+            }, row["expires_at"])
+        self.tokens.start()
+        if self.pending() and self.bot.scheduler.get("contributor_verify", "poll") is None:
+            await self.bot.scheduler.schedule("contributor_verify", "poll", FIRST_POLL_DELAY)
+
+    async def create_token(self, user_id: int, token: str) -> int:
+        """Store a new verification token for the user, replacing theirs if any. Returns its expiry timestamp."""
+        expires_at = int(time.time()) + VERIFY_WINDOW_MINUTES * 60
+        self.tokens.set(user_id, {
+            "user_id": user_id, "verification_token": token, "github_login": None, "guild_id": None, "last_checked_at": 0
+        }, expires_at)
+        await self.bot.db.create_verification_token(user_id, token, expires_at)
+        return expires_at
+
+    async def queue(self, member: discord.Member, github_login: str) -> bool:
+        """Start polling `github_login`'s bio for the member's token. Returns False if the token expired."""
+        verification = self.tokens.get(member.id)
+        if verification is None:
+            return False
+        verification.update(github_login=github_login, guild_id=member.guild.id, last_checked_at=0)
+        expires_at = int(time.time()) + VERIFY_WINDOW_MINUTES * 60
+        self.tokens.set(member.id, verification, expires_at)
+        await self.bot.db.queue_verification(member.id, member.guild.id, github_login, expires_at)
+        if self.bot.scheduler.get("contributor_verify", "poll") is None:
+            await self.bot.scheduler.schedule("contributor_verify", "poll", FIRST_POLL_DELAY)
+        return True
+
+    def pending(self) -> list:
+        return [verification for _, verification in self.tokens.items() if verification["github_login"]]
+
+    async def expire(self, user_id: int, verification: dict):
+        """Called by the token cache at the deadline"""
+        if verification["github_login"]:
+            await self.finish(verification, self.expired_embed(verification["github_login"]))
+        else:
+            await self.bot.db.remove_verification_token(user_id, verification["verification_token"])
+
+    async def poll(self, job):
+        """Check one batch of pending verifications, then schedule the next round while any are left"""
+        now = int(time.time())
+        batch = sorted(self.pending(), key=lambda verification: verification["last_checked_at"])[:BATCH_SIZE]
+
+        # Several members may claim the same account, its profile is fetched once
+        by_login = {}
+        for verification in batch:
+            by_login.setdefault(verification["github_login"].lower(), []).append(verification)
+
+        logins = list(by_login)
+        results = await asyncio.gather(*(self.fetch_profile(login) for login in logins), return_exceptions=True)
+
+        next_delay = POLL_INTERVAL
+        try:
+            for login, result in zip(logins, results):
+                if isinstance(result, GitHubRateLimited):
+                    next_delay = max(next_delay, result.reset_at - time.time())
+                    continue
+                if isinstance(result, Exception):
+                    logger.warning(f"Error fetching GitHub profile of {login} for verification: {result}", extra={"event": "verification_fetch_failed"})
+                    continue
+                for verification in by_login[login]:
+                    if self.tokens.get(verification["user_id"]) is not verification:
+                        continue  # expired or restarted while the profile was fetched
+                    try:
+                        await self.settle(verification, result, now)
+                    except Exception:
+                        # One failed verification must not hold up the others, it's checked again next round
+                        verification["last_checked_at"] = now
+                        logger.exception(
+                            f"Error verifying GitHub account {login} of user {verification['user_id']}",
+                            extra={"event": "verification_failed", "guild_id": verification["guild_id"]}
+                        )
+        finally:
+            if self.pending():
+                await self.bot.scheduler.schedule("contributor_verify", "poll", next_delay)
+
+    async def settle(self, verification, profile: Optional[dict], now: int):
+        if profile is None:
+            await self.finish(verification, self.not_found_embed(verification["github_login"]))
+        elif verification["verification_token"] in (profile.get("bio") or ""):
+            await self.complete(verification, profile["login"])
+        else:
+            verification["last_checked_at"] = now
+
+    async def fetch_profile(self, login: str) -> Optional[dict]:
+        """The user's GitHub profile, None if the account doesn't exist. Unchanged bios are served from the profile cache."""
+        return await self.bot.github.get_user(login, max_wait=POLL_MAX_WAIT)
+
+    async def complete(self, verification, github_login: str):
+        """
+        The token is in the bio: link the accounts, grant the role if the account contributed and tell
+        the member either way. If the role can't be granted now, a later contributors sync grants it.
+        """
+        self.discard(verification)  # settled, the expiry timer must not fire for it meanwhile
+        await self.bot.db.link_github_account(verification["user_id"], verification["guild_id"], github_login)
+        if not await self.bot.db.is_contributor(github_login):
+            await self.finish(verification, discord.Embed(
+                title="❌ Not a Contributor",
+                description=f"GitHub account **{github_login}** was verified, but we couldn't find contributions to our repositories.\n\n"
+                            "Your accounts are now linked, so you'll get the role automatically once a contributors sync "
+                            "(every 12 hours) finds your contributions.",
+                color=discord.Color.orange()
+            ))
+            return
+
+        member = await self.get_member(verification["guild_id"], verification["user_id"])
+        if member is None:
+            await self.finish(verification, discord.Embed(
+                title="✅ Accounts Linked",
+                description=f"GitHub account **{github_login}** was verified, but you're no longer a member of the server.\n\n"
+                            "Your accounts are linked, so you'll get the Contributor role automatically with the next "
+                            "contributors sync (every 12 hours) after you rejoin.",
+                color=discord.Color.orange()
+            ))
+            return
+        role = member.guild.get_role(CONTRIBUTOR_ROLE_ID)
+        if role is None:
+            await self.finish(verification, discord.Embed(
+                title="❌ Configuration Error",
+                description="Contributor role not found. Please contact an admin.",
+                color=discord.Color.red()
+            ))
+            return
+        try:
+            await member.add_roles(role, reason=f"Verified GitHub contributor {github_login}")
+        except discord.Forbidden:
+            await self.finish(verification, discord.Embed(
+                title="❌ Permission Error",
+                description="I don't have permission to assign roles. Please contact an admin.",
+                color=discord.Color.red()
+            ))
+            return
+        await self.bot.db.mark_contributor_roles_granted([verification["user_id"]], int(time.time()))
+        await self.finish(verification, discord.Embed(
+            title="🎉 Welcome Contributor!",
+            description=f"You have been granted the Contributor role!\n\n"
+                        f"Verified GitHub account: **{github_login}**\n\n"
+                        f"Thank you for your contributions to the project. You can now remove the token from your bio.",
+            color=discord.Color.green()
+        ))
+
+    def discard(self, verification):
+        """Drop a verification from the cache, unless the user got a new token since"""
+        if self.tokens.get(verification["user_id"]) is verification:
+            self.tokens.pop(verification["user_id"])
+
+    async def finish(self, verification, embed: discord.Embed):
+        """Drop the pending verification and DM the member its outcome"""
+        self.discard(verification)
+        await self.bot.db.remove_verification_token(verification["user_id"], verification["verification_token"])
+        try:
+            user = self.bot.get_user(verification["user_id"]) or await self.bot.fetch_user(verification["user_id"])
+            await user.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.info(f"Could not DM verification result to user {verification['user_id']}: {e}", extra={"event": "verification_dm_failed", "guild_id": verification["guild_id"]})
+
+    async def get_member(self, guild_id: int, user_id: int) -> Optional[discord.Member]:
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return None
+        member = guild.get_member(user_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(user_id)
+            except discord.HTTPException:
+                return None
+        return member
+
+    @staticmethod
+    def expired_embed(github_login: str) -> discord.Embed:
+        return discord.Embed(
+            title="❌ Verification Expired",
+            description=f"The verification token didn't show up in **{github_login}**'s GitHub bio within "
+                        f"{VERIFY_WINDOW_MINUTES} minutes. Please start over from the contributors channel.",
+            color=discord.Color.red()
+        )
+
+    @staticmethod
+    def not_found_embed(github_login: str) -> discord.Embed:
+        return discord.Embed(
+            title="❌ Verification Failed",
+            description=f"GitHub user '{github_login}' not found. Please check the username and start over.",
+            color=discord.Color.red()
+        )
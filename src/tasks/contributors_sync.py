@@ -1,78 +1,167 @@
 import asyncio
-import aiohttp
-from typing import List
+import logging
+import time
+import discord
+from typing import Optional
+
+from config import CONTRIBUTOR_ROLE_ID
+from utils.pacing import Pacer
+
+logger = logging.getLogger(__name__)
+
+# Repos fetched at the same time during a sync
+FETCH_CONCURRENCY = 4
+
+# Seconds between role grants when linked members become contributors
+ROLE_GRANT_INTERVAL = 1.0
+
+def format_summary(summary: dict) -> str:
+    return (
+        f"{summary['contributors']} contributors synced from {summary['repos']} repos"
+        + (f" ({summary['unchanged_repos']} not pushed to since their last sync)" if summary["unchanged_repos"] else "")
+        + f", {summary['unchanged_pages']}/{summary['pages']} pages unchanged"
+        + (f", contributor role granted to {summary['roles_granted']} linked members" if summary["roles_granted"] else "")
+        + (f", {summary['errors']} errors" if summary["errors"] else "")
+    )
 
 class ContributorsSync:
+    """Fetches contributors of the configured (or org-discovered) repos from GitHub, for the 12-hourly sync and /contributors-db-sync"""
+
     def __init__(self, bot):
         self.bot = bot
 
     async def initialize_tasks(self):
         """Start the contributors sync background task"""
         asyncio.create_task(self.contributors_sync_loop())
-        asyncio.create_task(self.cleanup_verification_tokens_loop())
 
     async def contributors_sync_loop(self):
         """Periodic task to sync contributors every 12 hours"""
         while True:
             try:
-                synced_count = await self.sync_contributors_from_github()
-                if synced_count > 0:
-                    print(f"Contributors database updated - {synced_count} contributors synced")
-            except Exception as e:
-                print(f"Error in contributors sync loop: {e}")
+                summary = await self.sync_contributors_from_github()
+                logger.info(f"Contributors sync - {format_summary(summary)}", extra={"event": "contributors_synced"})
+            except Exception:
+                logger.exception("Error in contributors sync loop", extra={"event": "contributors_sync_failed"})
             await asyncio.sleep(43200)  # Wait 12 hours (43200 seconds)
 
-    async def sync_contributors_from_github(self) -> int:
-        """Sync contributors from GitHub API for all configured repos"""
-        from config import REPOSITORIES
+    async def sync_contributors_from_github(self) -> dict:
+        """Sync contributors from GitHub API for the configured or discovered repos. Returns the sync summary."""
+        from config import REPOSITORIES, CONTRIBUTORS_SYNC_MODE, GITHUB_ORG
 
-        total_contributors = 0
+        summary = {
+            "repos": 0, "unchanged_repos": 0, "contributors": 0, "pages": 0, "unchanged_pages": 0,
+            "roles_granted": 0, "errors": 0
+        }
+        if CONTRIBUTORS_SYNC_MODE == "org":
+            repos = await self.discover_org_repos(GITHUB_ORG, summary)
+        else:
+            repos = [(repo.strip(), None) for repo in REPOSITORIES if repo.strip()]
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
 
-        async with aiohttp.ClientSession() as session:
-            for repo in REPOSITORIES:
-                if not repo.strip():
-                    continue
+        results = await asyncio.gather(*(self.sync_repo(semaphore, repo, pushed_at) for repo, pushed_at in repos))
+        summary["repos"] += len(repos)
+        for result in results:
+            for key in ("contributors", "pages", "unchanged_pages", "errors"):
+                summary[key] += result[key]
+        summary["roles_granted"] = await self.grant_linked_roles()
+        return summary
 
+    async def grant_linked_roles(self) -> int:
+        """
+        Grant the contributor role to members with a linked GitHub account that now has contributions.
+        Eligible members come from one join over links and contributors, role edits are paced.
+        """
+        granted = []
+        pacer = Pacer(ROLE_GRANT_INTERVAL)
+        for row in await self.bot.db.get_linked_contributors_without_role():
+            guild = self.bot.get_guild(row["guild_id"])
+            member = guild.get_member(row["discord_id"]) if guild else None
+            role = guild.get_role(CONTRIBUTOR_ROLE_ID) if guild else None
+            if member is None or role is None:
+                continue  # left the server, the link is kept in case they come back
+            if role not in member.roles:
+                await pacer.wait()
                 try:
-                    contributors = await self.fetch_repo_contributors(session, repo.strip())
-                    for contributor in contributors:
-                        await self.bot.db.add_contributor(contributor['login'], repo)
-                        total_contributors += 1
-                except Exception as e:
-                    print(f"Error syncing contributors for repo {repo}: {e}")
+                    await member.add_roles(role, reason=f"Linked GitHub account {row['github_login']} became a contributor")
+                except discord.HTTPException as e:
+                    logger.warning(f"Error granting contributor role to {member.id}: {e}", extra={"event": "contributor_role_failed", "guild_id": guild.id})
+                    continue
+            granted.append(member.id)
+        if granted:
+            await self.bot.db.mark_contributor_roles_granted(granted, int(time.time()))
+        return len(granted)
 
-        return total_contributors
+    async def discover_org_repos(self, org: str, summary: dict) -> list:
+        """
+        Refresh the org's public repo listing and return the repos to sync as [(full_name, pushed_at)]:
+        only those pushed to since their last sync, others can't have new contributors.
+        """
+        async def store_page(page: int, repos: list):
+            await self.bot.db.set_discovered_repos(
+                org, page, [(repo["full_name"], repo["pushed_at"]) for repo in repos if not repo["fork"]]
+            )
 
-    async def cleanup_verification_tokens_loop(self):
-        """Periodic task to clean up expired verification tokens"""
-        while True:
-            try:
-                await self.bot.db.cleanup_expired_tokens()
-            except Exception as e:
-                print(f"Error cleaning up verification tokens: {e}")
-            await asyncio.sleep(3600)  # Clean up every hour
+        try:
+            page_count = await self.fetch_pages(f"org:{org}", f"/orgs/{org}/repos?type=public&per_page=100", store_page, summary)
+            await self.bot.db.prune_discovered_repos(org, page_count)
+        except Exception as e:
+            # Carry on with the repos discovered by earlier syncs
+            logger.warning(f"Error discovering repos of {org}: {e}", extra={"event": "org_discovery_failed"})
+            summary["errors"] += 1
 
-    async def fetch_repo_contributors(self, session: aiohttp.ClientSession, repo: str) -> List[dict]:
-        """Fetch contributors for a specific repo from GitHub API"""
-        url = f"https://api.github.com/repos/{repo}/contributors"
-        contributors = []
+        to_sync = []
+        for repo in await self.bot.db.get_discovered_repos(org):
+            if repo["synced_pushed_at"] is not None and repo["synced_pushed_at"] == repo["pushed_at"]:
+                summary["unchanged_repos"] += 1
+            else:
+                to_sync.append((repo["full_name"], repo["pushed_at"]))
+        summary["repos"] += summary["unchanged_repos"]
+        return to_sync
 
-        page = 1
-        while True:
-            params = {'page': page, 'per_page': 100}
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    print(f"Error fetching contributors for {repo}: {response.status}")
-                    break
+    async def sync_repo(self, semaphore: asyncio.Semaphore, repo: str, pushed_at: Optional[str] = None) -> dict:
+        """Fetch and store the contributors of one repo, page by page"""
+        result = {"contributors": 0, "pages": 0, "unchanged_pages": 0, "errors": 0}
 
-                page_contributors = await response.json()
-                if not page_contributors:
-                    break
+        async def store_page(page: int, contributors: list):
+            await self.bot.db.add_contributors(repo, [contributor['login'] for contributor in contributors])
+            result["contributors"] += len(contributors)
 
-                contributors.extend(page_contributors)
-                page += 1
+        try:
+            async with semaphore:
+                page_count = await self.fetch_pages(repo, f"/repos/{repo}/contributors?per_page=100", store_page, result)
+            if pushed_at is not None:
+                await self.bot.db.mark_repo_synced(repo, pushed_at, page_count)
+        except Exception as e:
+            logger.warning(f"Error syncing contributors for repo {repo}: {e}", extra={"event": "repo_sync_failed"})
+            result["errors"] += 1
+        return result
 
-                # GitHub API rate limiting
-                await asyncio.sleep(0.1)
+    async def fetch_pages(self, key: str, url: str, store_page, result: dict) -> int:
+        """
+        Walk a paginated listing following the Link header, sending If-None-Match with the ETag
+        stored per (key, page). Changed pages are passed to `store_page`, unchanged (304) pages
+        are skipped. A 304 only costs no quota with GITHUB_TOKEN set, unauthenticated requests
+        count either way. Returns the number of pages.
+        """
+        etags = await self.bot.db.get_page_etags(key)
+        page = 0
+        while url:
+            page += 1
+            stored = etags.get(page)
+            headers = {"If-None-Match": stored[0]} if stored else {}
+            response = await self.bot.github.get(url, headers=headers)
+            result["pages"] += 1
+            if response.status == 304:
+                result["unchanged_pages"] += 1
+                url = stored[1]
+                continue
+            if response.status != 200:
+                # Rate limits were already waited out and retried, this is a real failure
+                raise Exception(f"HTTP {response.status} fetching page {page}")
 
-        return contributors
\ No newline at end of file
+            await store_page(page, response.data)
+            etag = response.headers.get("ETag")
+            if etag:
+                await self.bot.db.set_page_etag(key, page, etag, response.next_url)
+            url = response.next_url
+        return page
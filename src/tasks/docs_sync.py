@@ -1,22 +1,115 @@
 import asyncio
+import logging
+import random
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 COOLBOT_JSON_URL = "https://next.coolify.io/docs/coolbot.json"
 
+# Poll interval bounds, the interval shrinks while the ETag keeps changing and grows while it doesn't
+MIN_INTERVAL = 15 * 60
+DEFAULT_INTERVAL = 60 * 60
+MAX_INTERVAL = 6 * 60 * 60
+
+# Retry delays after failed syncs
+BACKOFF_BASE = 60
+BACKOFF_MAX = 60 * 60
+
+def format_diff(diff: dict, limit: int = 10) -> str:
+    """Counts line plus up to `limit` changed names, e.g. for logs and the /docs-db-sync embed"""
+    lines = [f"+{len(diff['added'])} added, -{len(diff['removed'])} removed, ~{len(diff['changed'])} changed"]
+    names = (
+        [f"+ {entry['name']}" for entry in diff["added"]]
+        + [f"- {name}" for name in diff["removed"]]
+        + [f"~ {entry['name']}" for entry in diff["changed"]]
+    )
+    lines.extend(names[:limit])
+    if len(names) > limit:
+        lines.append(f"... and {len(names) - limit} more")
+    return "\n".join(lines)
+
 class DocsSync:
+    """
+    Coordinates every docs sync. Concurrent callers share one in-flight run, failed runs
+    are retried with exponential backoff and jitter, and the poll interval follows how
+    often coolbot.json actually changes.
+    """
+
     def __init__(self, bot):
         self.bot = bot
+        self.in_flight: Optional[asyncio.Future] = None
+        self.interval = DEFAULT_INTERVAL
+        self.failures = 0
+        self.next_delay = DEFAULT_INTERVAL
+        self.next_sync_at: Optional[int] = None
 
     async def initialize_tasks(self):
-        """Start the docs sync background task"""
+        """Build the doc search index and start the docs sync background task"""
+        await self.refresh_index()
         asyncio.create_task(self.docs_sync_loop())
 
+    async def refresh_index(self):
+        """Rebuild the in-memory doc search index and suggester from the database"""
+        entries = await self.bot.db.get_doc_entries()
+        self.bot.doc_index.rebuild(entries)
+        self.bot.doc_suggester.rebuild(entries)
+
+    async def apply_diff(self, diff: dict):
+        """Update the search index for just the synced changes"""
+        self.bot.doc_index.update(diff["added"], diff["removed"], diff["changed"])
+        # Suggester weights depend on document frequencies across all docs
+        self.bot.doc_suggester.rebuild(await self.bot.db.get_doc_entries())
+
+    @property
+    def running(self) -> bool:
+        return self.in_flight is not None and not self.in_flight.done()
+
+    async def sync(self) -> Tuple[bool, dict]:
+        """Sync docs from coolbot.json, joining the sync already in progress if there is one"""
+        if not self.running:
+            self.in_flight = asyncio.ensure_future(self.run_sync())
+        # Shielded so a caller giving up (e.g. an expired interaction) doesn't cancel it for everyone
+        return await asyncio.shield(self.in_flight)
+
+    async def run_sync(self) -> Tuple[bool, dict]:
+        try:
+            updated, status_info = await self.bot.db.sync_docs_from_url(COOLBOT_JSON_URL, self.bot.http_client.session)
+            if updated:
+                await self.apply_diff(status_info["diff"])
+        except Exception as e:
+            updated, status_info = False, {"url": COOLBOT_JSON_URL, "error": str(e)}
+
+        if status_info.get("error"):
+            self.failures += 1
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 1))
+            self.next_delay = delay / 2 + random.uniform(0, delay / 2)
+        else:
+            self.failures = 0
+            if updated:
+                self.interval = max(MIN_INTERVAL, self.interval // 2)
+            else:
+                self.interval = min(MAX_INTERVAL, int(self.interval * 1.5))
+            self.next_delay = self.interval
+        return updated, status_info
+
     async def docs_sync_loop(self):
-        """Periodic task to sync docs every hour"""
+        """Periodic task to sync docs, at the adaptive interval or the backoff delay after errors"""
         while True:
             try:
-                updated, status_info = await self.bot.db.sync_docs_from_url(COOLBOT_JSON_URL)
-                if updated:
-                    print(f"Docs database updated from remote URL - {status_info['docs_count']} entries")
-            except Exception as e:
-                print(f"Error in docs sync loop: {e}")
-            await asyncio.sleep(3600)  # Wait 1 hour
\ No newline at end of file
+                updated, status_info = await self.sync()
+                if status_info.get("error"):
+                    logger.warning(f"Docs sync failed ({self.failures} in a row): {status_info['error']}", extra={"event": "docs_sync_failed"})
+                elif updated:
+                    logger.info(
+                        f"Docs database updated from remote URL - {status_info['docs_count']} entries\n"
+                        f"{format_diff(status_info['diff'])}",
+                        extra={"event": "docs_synced"}
+                    )
+                else:
+                    logger.debug("Docs unchanged since the last sync", extra={"event": "docs_unchanged"})
+            except Exception:
+                logger.exception("Error in docs sync loop", extra={"event": "docs_sync_failed"})
+            self.next_sync_at = int(time.time() + self.next_delay)
+            await asyncio.sleep(self.next_delay)
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import logging
+import random
+import time
+import aiohttp
+from typing import Optional
+
+from config import NTFY_SECOND_TOPIC
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Titles of the action buttons on a page notification, any of them acknowledges the page
+ACK_TITLES = ("On it", "Soon (Next 30 mins)", "Later (> 1 hour)")
+
+# How long a page is waited on for an acknowledgement
+WAITER_TTL = 12 * 60 * 60
+
+# Reconnect delays after the subscription drops
+BACKOFF_BASE = 1
+BACKOFF_MAX = 5 * 60
+
+# ntfy sends a keepalive every 45 seconds, a quiet connection longer than this is dead
+HEARTBEAT = 60
+
+class PageAcks:
+    """
+    One long-lived subscription to the ntfy response topic, shared by every /page. Acknowledgements
+    are routed by the page's random ID to the future waiting on it. Waiters expire after WAITER_TTL.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.waiters = TTLCache(on_expire=self.expire)  # random_id -> asyncio.Future
+        self.connected = False
+        self.failures = 0
+        self.last_message_id: Optional[str] = None
+        self.since: Optional[int] = None  # unix time the first connect replays from
+        self.loop_task: Optional[asyncio.Task] = None
+
+    async def initialize_tasks(self):
+        """Start the subscriber, if a response topic is configured. Runs after page_delivery restored its waiters."""
+        self.waiters.start()
+        if NTFY_SECOND_TOPIC:
+            # Replay from the oldest page still waited on, to route acknowledgements published while we were down
+            pages = await self.bot.db.get_unacknowledged_pages(int(time.time() - WAITER_TTL))
+            if pages:
+                self.since = min(page["sent_at"] for page in pages)
+            self.loop_task = asyncio.create_task(self.subscribe_loop())
+
+    def wait_for(self, random_id: str, ttl: float = WAITER_TTL) -> asyncio.Future:
+        """Future resolved with the acknowledgement title once the page `random_id` is acknowledged"""
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.set(random_id, future, time.time() + ttl)
+        return future
+
+    def ids(self) -> list:
+        return [random_id for random_id, _ in self.waiters.items()]
+
+    def cancel(self, random_id: str) -> bool:
+        """Stop waiting for a page's acknowledgement. Returns whether it was being waited on."""
+        future = self.waiters.pop(random_id)
+        if future is None:
+            return False
+        future.cancel()
+        return True
+
+    def cancel_all(self) -> int:
+        ids = self.ids()
+        for random_id in ids:
+            self.cancel(random_id)
+        return len(ids)
+
+    async def expire(self, random_id: str, future: asyncio.Future):
+        future.cancel()
+
+    async def subscribe_loop(self):
+        """Keep the subscription open, reconnecting with exponential backoff and jitter"""
+        while True:
+            try:
+                await self.subscribe()
+            except Exception as e:
+                logger.warning(f"Page acknowledgement subscription error: {e}", extra={"event": "page_ack_subscription_failed"})
+            self.connected = False
+            self.failures += 1
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 1))
+            await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+
+    async def subscribe(self):
+        # Ask for what was published while we were away: since the last message after a reconnect,
+        # since the oldest unacknowledged page after a restart
+        url = f"wss://ntfy.sh/{NTFY_SECOND_TOPIC}/ws"
+        since = self.last_message_id or self.since
+        if since:
+            url += f"?since={since}"
+        async with self.bot.http_client.session.ws_connect(url, heartbeat=HEARTBEAT) as ws:
+            self.connected = True
+            self.failures = 0
+            logger.info("Page acknowledgement subscription connected", extra={"event": "page_ack_subscribed"})
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self.route(msg.data)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception() or Exception("WebSocket error")
+        logger.info("Page acknowledgement subscription closed", extra={"event": "page_ack_unsubscribed"})
+
+    def route(self, raw: str):
+        """Resolve the waiter of the page an incoming message acknowledges"""
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        if data.get("event") != "message":
+            return  # open and keepalive events
+        self.last_message_id = data.get("id", self.last_message_id)
+        if data.get("title") not in ACK_TITLES:
+            return
+        future = self.waiters.pop(data.get("message"))
+        if future is not None and not future.done():
+            future.set_result(data["title"])
@@ -0,0 +1,271 @@
+import asyncio
+import difflib
+import json
+import logging
+import random
+import re
+import time
+import discord
+from typing import Optional
+
+from config import (
+    PAGE_ACTIONS_THREAD_ID,
+    PAGE_RESPONSE_WEBHOOK_URL,
+    NTFY_TOPIC_NAME,
+    NTFY_SECOND_TOPIC,
+    NTFY_ESCALATION_TOPIC,
+    PAGE_ESCALATION_MINUTES
+)
+from tasks.page_acks import WAITER_TTL
+
+logger = logging.getLogger(__name__)
+
+NTFY_URL = "https://ntfy.sh/"
+
+# Delivery retries: exponential backoff with jitter, given up after MAX_ATTEMPTS
+RETRY_BASE = 5
+RETRY_MAX = 5 * 60
+MAX_ATTEMPTS = 8
+
+# A page for the same service within DEDUP_WINDOW_MINUTES whose description is at least this similar asks for confirmation
+DEDUP_WINDOW_MINUTES = 15
+DEDUP_SIMILARITY = 0.6
+
+SEVERITY_EMOJIS = {
+    1: "green_circle",  # information
+    2: "yellow_circle",  # Minor
+    3: "orange_circle",  # Major
+    4: "red_circle"   # Critical - Critical
+}
+
+def generate_random_id():
+    """Generate a random alphanumeric ID for acknowledgement tracking"""
+    chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    return ''.join(random.choice(chars) for _ in range(8))
+
+def normalize_title(title: str) -> str:
+    """Service key of a page title: lowercased, punctuation and repeated whitespace collapsed"""
+    return " ".join(re.findall(r"[a-z0-9]+", title.lower()))
+
+def description_similarity(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, normalize_title(a), normalize_title(b)).ratio()
+
+def build_payload(random_id: str, title: str, message: str, priority: int, click_url: str, user: Optional[discord.Member]) -> dict:
+    """The ntfy notification of a page, with acknowledgement actions that publish to the response topic"""
+    tags = [SEVERITY_EMOJIS.get(priority, "question")]
+    if not user:  # automated page
+        tags.append("robot")  # 🤖
+    data = {
+        "topic": NTFY_TOPIC_NAME,
+        "message": message,
+        "title": title,
+        "tags": tags,
+        "click": click_url,
+        "actions": [
+            {
+                "action": "http",
+                "label": "On it",
+                "url": f"https://ntfy.sh/{NTFY_SECOND_TOPIC or 'default'}",
+                "headers": {"Title": "On it", "message": random_id},
+                "clear": True
+            },
+            {
+                "action": "http",
+                "label": "Soon (Next 30mins)",
+                "url": f"https://ntfy.sh/{NTFY_SECOND_TOPIC or 'default'}",
+                "headers": {"Title": "Soon (Next 30 mins)", "message": random_id},
+                "clear": True
+            },
+            {
+                "action": "http",
+                "label": "Later (>1 hour)",
+                "url": f"https://ntfy.sh/{NTFY_SECOND_TOPIC or 'default'}",
+                "headers": {"Title": "Later (> 1 hour)", "message": random_id},
+                "clear": True
+            }
+        ] if NTFY_SECOND_TOPIC else []
+    }
+    if priority == 4:
+        data["priority"] = 5
+    if user and hasattr(user, 'display_avatar'):
+        data["icon"] = user.display_avatar.url
+    return data
+
+class PageDelivery:
+    """
+    Delivers pages through a persisted queue. A page is stored before it is sent, failed sends are
+    retried with backoff on the scheduler, and sent pages are tracked until acknowledged. Critical
+    pages without an acknowledgement after PAGE_ESCALATION_MINUTES are sent again to the escalation topic.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        bot.scheduler.register("page_deliver", self.retry)
+        bot.scheduler.register("page_escalate", self.escalate)
+
+    async def initialize_tasks(self):
+        """
+        Pick up pages from before the restart (run after the scheduler restored its jobs): queued pages
+        whose first attempt was cut short get a delivery job, sent ones are waited on again for an acknowledgement.
+        Retries and escalations are already scheduler jobs.
+        """
+        for page in await self.bot.db.get_queued_pages():
+            if self.bot.scheduler.get("page_deliver", page["id"]) is None:
+                await self.bot.scheduler.schedule("page_deliver", page["id"], 0, {"page_id": page["id"]})
+        if not NTFY_SECOND_TOPIC:
+            return
+        now = time.time()
+        for page in await self.bot.db.get_unacknowledged_pages(int(now - WAITER_TTL)):
+            self.track(page["id"], page["sent_at"] + WAITER_TTL - now)
+
+    async def enqueue(self, title: str, message: str, priority: int, followup: discord.Message,
+                      user: Optional[discord.Member] = None) -> str:
+        """Store a page and make the first delivery attempt. Returns the page ID."""
+        page_id = generate_random_id()
+        payload = build_payload(page_id, title, message, priority, followup.jump_url, user)
+        await self.bot.db.add_page(
+            page_id, title, normalize_title(title.split(' | ')[0]), message, priority, user.id if user else None, user.name if user else None,
+            followup.channel.id, followup.id, followup.jump_url, json.dumps(payload)
+        )
+        await self.deliver(page_id)
+        return page_id
+
+    async def find_duplicate(self, service: str, description: str):
+        """The most recent page for the same service with a similar description, if one was sent within the dedup window"""
+        since = int(time.time()) - DEDUP_WINDOW_MINUTES * 60
+        for page in await self.bot.db.get_recent_pages(normalize_title(service), since):
+            if description_similarity(page["message"], description) >= DEDUP_SIMILARITY:
+                return page
+        return None
+
+    async def retry(self, job):
+        await self.deliver(job.payload["page_id"])
+
+    async def deliver(self, page_id: str):
+        """Send a queued page to ntfy, scheduling a retry if that fails"""
+        page = await self.bot.db.get_page(page_id)
+        if page is None or page["status"] != "queued":
+            return
+        attempts = page["attempts"] + 1
+        error = await self.post(page["payload"])
+
+        if error is None:
+            await self.bot.db.record_page_attempt(page_id, attempts, "sent")
+            await self.on_sent(page)
+        elif attempts >= MAX_ATTEMPTS:
+            await self.bot.db.record_page_attempt(page_id, attempts, "failed", error)
+            await self.edit_followup(page, f"An error occurred while sending the notification, gave up after {attempts} attempts...\n{error}")
+        else:
+            delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempts - 1))
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            await self.bot.db.record_page_attempt(page_id, attempts, "queued", error)
+            await self.bot.scheduler.schedule("page_deliver", page_id, delay, {"page_id": page_id})
+            await self.edit_followup(
+                page,
+                f"An error occurred while sending the notification (attempt {attempts}/{MAX_ATTEMPTS}), "
+                f"retrying <t:{int(time.time() + delay)}:R>...\n-# {error}"
+            )
+
+    async def post(self, payload: str) -> Optional[str]:
+        """Publish a notification. Returns the error, None once ntfy accepted it."""
+        try:
+            async with self.bot.http_client.session.post(NTFY_URL, data=payload) as response:
+                if response.status == 200:
+                    return None
+                return f"Status: {response.status}, Response: {await response.text()}"
+        except Exception as e:
+            return str(e) or type(e).__name__
+
+    async def on_sent(self, page):
+        logger.info(
+            f"Page {page['id']} sent after {page['attempts'] + 1} attempts",
+            extra={"event": "page_sent", "latency_ms": (time.time() - page["created_at"]) * 1000}
+        )
+        title = page["title"].split(' | ')[0]
+        if page["user_name"]:
+            self.send_log(
+                f" `{page['user_name']}` used **/page**. Title: `{title}` | Description: `{page['message']}` | "
+                f"Priority: `{page['priority']}` | ID: `{page['id']}`"
+            )
+            await self.edit_followup(page, f"Notification sent successfully.\n-# Title: `{title}` | Description: `{page['message']}` | Priority: `{page['priority']}` |  ID: `{page['id']}`")
+        else:
+            # For automated pages, we don't have user/title/description, so skip logging
+            await self.edit_followup(page, f"Automated page sent successfully.\n-# Priority: {page['priority']} | ID: `{page['id']}`")
+
+        if NTFY_SECOND_TOPIC:
+            self.track(page["id"])
+            if page["priority"] == 4:
+                await self.bot.scheduler.schedule(
+                    "page_escalate", page["id"], PAGE_ESCALATION_MINUTES * 60, {"page_id": page["id"]}
+                )
+
+    def track(self, page_id: str, ttl: float = WAITER_TTL):
+        ack = self.bot.page_acks.wait_for(page_id, ttl)
+        asyncio.create_task(self.await_ack(page_id, ack))
+
+    async def await_ack(self, page_id: str, ack: asyncio.Future):
+        """Record a page's acknowledgement and forward it to the response webhook"""
+        try:
+            # Shielded, so cancelling this task (on shutdown) leaves `ack` alone and the two can be told apart
+            title = await asyncio.shield(ack)
+        except asyncio.CancelledError:
+            if not ack.cancelled():
+                raise  # shutting down, the persisted escalation has to fire after the restart
+            # Closed with /page-ws-close or expired, nobody is waiting for it anymore
+            await self.bot.scheduler.cancel("page_escalate", page_id)
+            return
+
+        await self.bot.db.mark_page_acknowledged(page_id, title)
+        await self.bot.scheduler.cancel("page_escalate", page_id)
+        page = await self.bot.db.get_page(page_id)
+        logger.info(
+            f"Page {page_id} acknowledged: {title}",
+            extra={"event": "page_acknowledged", "latency_ms": (page["acknowledged_at"] - page["sent_at"]) * 1000}
+        )
+
+        # Send webhook notification if configured
+        if PAGE_RESPONSE_WEBHOOK_URL:
+            webhook_data = {
+                "content": f"{title}\n-# Reply to {page['jump_url']}"
+            }
+            try:
+                async with self.bot.http_client.session.post(PAGE_RESPONSE_WEBHOOK_URL, json=webhook_data) as resp:
+                    if resp.status != 204:
+                        logger.warning(f"Webhook failed with status {resp.status}", extra={"event": "page_webhook_failed"})
+            except Exception as e:
+                logger.warning(f"Webhook error: {e}", extra={"event": "page_webhook_failed"})
+
+        # Log the response
+        self.send_log(f"Page response received: `{title}` | ID: `{page_id}`")
+
+    async def escalate(self, job):
+        """Send a critical page nobody acknowledged again, to the escalation topic"""
+        page = await self.bot.db.get_page(job.payload["page_id"])
+        if page is None or page["status"] != "sent":
+            return
+        payload = json.loads(page["payload"])
+        payload["topic"] = NTFY_ESCALATION_TOPIC or NTFY_TOPIC_NAME
+        payload["title"] = f"[Unacknowledged {PAGE_ESCALATION_MINUTES}m] {payload['title']}"
+        error = await self.post(json.dumps(payload))
+        if error is not None:
+            await self.bot.scheduler.schedule("page_escalate", page["id"], RETRY_MAX, job.payload)
+            self.send_log(f"Escalating page `{page['id']}` failed, retrying in {RETRY_MAX // 60} minutes: {error}")
+            return
+        await self.bot.db.mark_page_escalated(page["id"])
+        self.send_log(
+            f"Page `{page['id']}` was not acknowledged within {PAGE_ESCALATION_MINUTES} minutes, "
+            f"escalated to `{payload['topic']}`"
+        )
+
+    async def edit_followup(self, page, content: str):
+        channel = self.bot.get_channel(page["channel_id"])
+        if channel is None:
+            return
+        try:
+            await channel.get_partial_message(page["message_id"]).edit(content=content)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to update page message {page['id']}: {e}", extra={"event": "page_followup_failed"})
+
+    def send_log(self, message: str):
+        """Log a message to the page actions thread"""
+        self.bot.log_sink.log(PAGE_ACTIONS_THREAD_ID, message)
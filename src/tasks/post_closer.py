@@ -1,51 +1,38 @@
-import asyncio
+import logging
 import discord
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+async def resolve_thread(bot, thread_id: int) -> Optional[discord.Thread]:
+    """Get a thread from cache, falling back to the API for archived (uncached) threads"""
+    channel = bot.get_channel(thread_id)
+    if channel is None:
+        try:
+            channel = await bot.fetch_channel(thread_id)
+        except (discord.NotFound, discord.Forbidden):
+            return None
+    return channel if isinstance(channel, discord.Thread) else None
+
 class PostCloser:
     def __init__(self, bot):
         self.bot = bot
-        self.close_tasks = {}
+        bot.scheduler.register("post_close", self.close_post)
 
-    async def initialize_tasks(self):
-        """Load and start pending close tasks from database"""
-        tasks = await self.bot.db.get_pending_closes()
-        for task in tasks:
-            thread_id = task['thread_id']
-            channel = self.bot.get_channel(thread_id)
-            if channel and isinstance(channel, discord.Thread):
-                if not (channel.locked or channel.archived):
-                    self.close_tasks[thread_id] = asyncio.create_task(
-                        self.close_post(channel, task['close_at'])
-                    )
-                else:
-                    await self.bot.db.remove_close_task(thread_id)
-
-    async def schedule_close(self, thread: discord.Thread, delay: int = 3600):
-        """Schedule a thread to be closed after the specified delay"""
-        if thread.id in self.close_tasks:
-            self.close_tasks[thread.id].cancel()
-        
-        self.close_tasks[thread.id] = asyncio.create_task(
-            self.close_post(thread, delay)
-        )
-        await self.bot.db.add_close_task(thread.id, delay)
+    async def schedule_close(self, thread: discord.Thread, delay: int = 3600) -> int:
+        """Schedule a thread to be closed after the specified delay. Returns the close timestamp."""
+        job = await self.bot.scheduler.schedule("post_close", thread.id, delay, {"thread_id": thread.id})
+        return job.due_at
 
     async def cancel_close(self, thread_id: int):
         """Cancel a scheduled thread close"""
-        if thread_id in self.close_tasks:
-            self.close_tasks[thread_id].cancel()
-            self.close_tasks.pop(thread_id)
-        await self.bot.db.remove_close_task(thread_id)
+        await self.bot.scheduler.cancel("post_close", thread_id)
 
-    async def close_post(self, thread: discord.Thread, delay: int):
-        """Close and lock a thread after the specified delay"""
-        await asyncio.sleep(delay)
-        try:
-            await thread.edit(archived=True, locked=True, reason="Auto archive solved post")
-            print(f"Thread {thread.id} archived and locked.")
-        except Exception as e:
-            print(f"Error archiving thread {thread.id}: {e}")
-        finally:
-            self.close_tasks.pop(thread.id, None)
-            await self.bot.db.remove_close_task(thread.id)
+    async def close_post(self, job):
+        """Close and lock a thread once its scheduled close is due"""
+        thread_id = job.payload["thread_id"]
+        thread = await resolve_thread(self.bot, thread_id)
+        if thread is None or (thread.archived and thread.locked):
+            return
+        await thread.edit(archived=True, locked=True, reason="Auto archive solved post")
+        logger.info(f"Thread {thread.id} archived and locked.", extra={"event": "post_closed", "guild_id": thread.guild.id, "thread_id": thread.id})
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import logging
+import math
+import time
+import discord
+from typing import Awaitable, Callable, Dict, Optional
+
+from config import STARTUP_LOG_THREAD_ID
+from utils.deadline_heap import DeadlineHeap
+from utils.pacing import Pacer
+
+logger = logging.getLogger(__name__)
+
+CATCH_UP_WORKERS = 4
+CATCH_UP_INTERVAL = 0.5  # seconds between overdue jobs across all workers
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+class ScheduledJob:
+    __slots__ = ("job_id", "job_type", "due_at", "payload", "seq")
+
+    def __init__(self, job_id: str, job_type: str, due_at: int, payload: dict):
+        self.job_id = job_id
+        self.job_type = job_type
+        self.due_at = due_at
+        self.payload = payload
+        self.seq = 0
+
+class Scheduler:
+    """
+    Runs delayed jobs (post closes and friends) from a single timer over a DeadlineHeap.
+    Jobs are persisted with their absolute due time, type and payload, so they survive restarts.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.handlers: Dict[str, Callable[[ScheduledJob], Awaitable[None]]] = {}
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.deadlines = DeadlineHeap(self.is_current, self.on_due)  # cancelled or rescheduled jobs are skipped
+        self.running: set = set()
+        self.catch_up_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def make_job_id(job_type: str, key) -> str:
+        return f"{job_type}:{key}"
+
+    def register(self, job_type: str, handler: Callable[[ScheduledJob], Awaitable[None]]):
+        """Register the coroutine that runs jobs of `job_type` when they are due. It raises on failure, which is logged and counted."""
+        self.handlers[job_type] = handler
+
+    def get(self, job_type: str, key) -> Optional[ScheduledJob]:
+        return self.jobs.get(self.make_job_id(job_type, key))
+
+    async def schedule(self, job_type: str, key, delay: float, payload: Optional[dict] = None) -> ScheduledJob:
+        """Schedule (or reschedule) the job identified by `job_type` and `key` to run after `delay` seconds"""
+        job_id = self.make_job_id(job_type, key)
+        job = ScheduledJob(job_id, job_type, math.ceil(time.time() + delay), payload or {})
+        self.push(job)
+        await self.bot.db.add_scheduled_job(job.job_id, job.job_type, job.due_at, json.dumps(job.payload))
+        return job
+
+    async def cancel(self, job_type: str, key) -> bool:
+        """Cancel a scheduled job. Returns whether a job was pending."""
+        job_id = self.make_job_id(job_type, key)
+        job = self.jobs.pop(job_id, None)
+        await self.bot.db.remove_scheduled_job(job_id)
+        return job is not None
+
+    async def update_payload(self, job: ScheduledJob, **fields):
+        """Add fields to a pending job's payload, keeping its due time"""
+        if self.jobs.get(job.job_id) is not job:
+            return  # already ran, cancelled or rescheduled
+        job.payload.update(fields)
+        await self.bot.db.add_scheduled_job(job.job_id, job.job_type, job.due_at, json.dumps(job.payload))
+
+    def push(self, job: ScheduledJob):
+        job.seq = self.deadlines.push(job.due_at, job.job_id)
+        self.jobs[job.job_id] = job
+
+    async def initialize_tasks(self):
+        """Restore persisted jobs, start the timer loop and catch up on jobs that came due while offline"""
+        rows = await self.bot.db.get_scheduled_jobs()
+        now = time.time()
+        overdue = []
+        for row in rows:
+            if row['job_id'] in self.jobs:
+                continue  # scheduled again before we got here
+            job = ScheduledJob(row['job_id'], row['job_type'], row['due_at'], json.loads(row['payload']))
+            if job.due_at <= now:
+                # Tracked for get()/cancel() but kept off the heap, catch_up() runs these
+                self.jobs[job.job_id] = job
+                overdue.append(job)
+            else:
+                self.push(job)
+        self.deadlines.start()
+        if overdue:
+            self.catch_up_task = asyncio.create_task(self.catch_up(overdue, restored=len(self.jobs) - len(overdue)))
+
+    async def catch_up(self, overdue: list, restored: int):
+        """
+        Run jobs that came due during downtime through a small worker pool, paced so
+        a long outage doesn't turn into a burst of API calls. Most overdue first.
+        """
+        overdue.sort(key=lambda job: job.due_at)
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in overdue:
+            queue.put_nowait(job)
+        pacer = Pacer(CATCH_UP_INTERVAL)
+        started = time.time()
+        stats = {"succeeded": 0, "failed": 0, "lateness": []}
+
+        async def worker():
+            while not queue.empty():
+                job = queue.get_nowait()
+                await pacer.wait()
+                if self.jobs.get(job.job_id) is not job:
+                    continue  # cancelled or rescheduled since startup
+                del self.jobs[job.job_id]
+                stats["lateness"].append(time.time() - job.due_at)
+                if await self.execute(job):
+                    stats["succeeded"] += 1
+                else:
+                    stats["failed"] += 1
+
+        await asyncio.gather(*(worker() for _ in range(min(CATCH_UP_WORKERS, len(overdue)))))
+        await self.send_catch_up_report(stats, restored, time.time() - started)
+
+    async def send_catch_up_report(self, stats: dict, restored: int, duration: float):
+        lateness = stats["lateness"]
+        lines = [
+            f"**Overdue jobs run:** {stats['succeeded'] + stats['failed']} ({stats['failed']} failed)",
+            f"**Future jobs restored:** {restored}",
+            f"**Catch-up duration:** {format_duration(duration)}"
+        ]
+        if lateness:
+            lines.append(
+                f"**Lateness:** max {format_duration(max(lateness))}, "
+                f"average {format_duration(sum(lateness) / len(lateness))}"
+            )
+        logger.info(
+            "Scheduler catch-up finished - " + " | ".join(line.replace("**", "") for line in lines),
+            extra={"event": "scheduler_caught_up", "latency_ms": max(lateness) * 1000 if lateness else None}
+        )
+
+        embed = discord.Embed(
+            title="Scheduled Jobs Catch-up",
+            description="\n".join(lines),
+            color=discord.Color.orange() if stats["failed"] else discord.Color.green(),
+            timestamp=discord.utils.utcnow()
+        )
+        self.bot.log_sink.log(STARTUP_LOG_THREAD_ID, embed=embed)
+
+    def is_current(self, seq: int, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        return job is not None and job.seq == seq
+
+    def on_due(self, job_id: str):
+        job = self.jobs.pop(job_id)
+        task = asyncio.create_task(self.execute(job))
+        self.running.add(task)
+        task.add_done_callback(self.running.discard)
+
+    async def execute(self, job: ScheduledJob) -> bool:
+        """Run a job's handler. Returns whether it completed without raising."""
+        handler = self.handlers.get(job.job_type)
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                logger.warning(f"No handler registered for scheduled job {job.job_id}, dropping it", extra={"event": "job_dropped"})
+                return False
+            await handler(job)
+            logger.debug(
+                f"Ran scheduled job {job.job_id}",
+                extra={"event": "job_ran", "latency_ms": (time.perf_counter() - started) * 1000}
+            )
+            return True
+        except Exception:
+            logger.exception(f"Error running scheduled job {job.job_id}", extra={"event": "job_failed", "thread_id": job.payload.get("thread_id")})
+            return False
+        finally:
+            if job.job_id not in self.jobs:  # the handler may have rescheduled it
+                await self.bot.db.remove_scheduled_job(job.job_id)
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import discord
+from typing import Optional
+
+from config import (
+    SUPPORT_CHANNEL_ID,
+    STARTUP_LOG_THREAD_ID,
+    UNANSWERED_TAG_ID,
+    NOT_SOLVED_TAG_ID,
+    SOLVED_TAG_ID,
+    WAITING_FOR_REPLY_TAG_ID,
+    NEED_DEV_REVIEW_TAG_ID,
+    TAG_RECONCILE_INTERVAL_HOURS,
+    TAG_RECONCILE_DRY_RUN,
+)
+from utils.pacing import Pacer
+
+logger = logging.getLogger(__name__)
+
+HISTORY_LIMIT = 50
+
+def compute_tags(thread: discord.Thread, post_creator_id: Optional[int], messages: list, bot_user_id: int) -> list:
+    """
+    Recompute the tag set of a support post from its activity, following the same rules
+    AutoAddCog applies live. `messages` is the recent history, newest first.
+    """
+    forum = thread.parent
+    unanswered = forum.get_tag(UNANSWERED_TAG_ID)
+    not_solved = forum.get_tag(NOT_SOLVED_TAG_ID)
+    waiting = forum.get_tag(WAITING_FOR_REPLY_TAG_ID)
+    tags = list(thread.applied_tags)
+    if not unanswered or not not_solved or not waiting:
+        return tags
+
+    human_messages = [m for m in messages if m.author.id != bot_user_id]
+    answered = any(m.author.id != post_creator_id for m in human_messages)
+    if not answered and (thread.message_count or 0) > HISTORY_LIMIT:
+        # Reply might be older than the history we looked at, leave the post alone
+        return tags
+
+    tag_ids = {t.id for t in tags}
+    if answered and unanswered.id in tag_ids:
+        tags = [t for t in tags if t.id != UNANSWERED_TAG_ID]
+        if not_solved.id not in tag_ids:
+            tags.append(not_solved)
+    elif not answered and not tag_ids & {UNANSWERED_TAG_ID, NOT_SOLVED_TAG_ID, NEED_DEV_REVIEW_TAG_ID}:
+        tags.append(unanswered)
+
+    if any(t.id == UNANSWERED_TAG_ID for t in tags) or not human_messages:
+        return tags
+    last_is_creator = human_messages[0].author.id == post_creator_id
+    has_waiting = any(t.id == WAITING_FOR_REPLY_TAG_ID for t in tags)
+    if last_is_creator and not has_waiting:
+        tags.append(waiting)
+    elif not last_is_creator and has_waiting:
+        tags = [t for t in tags if t.id != WAITING_FOR_REPLY_TAG_ID]
+    return tags
+
+class TagReconciler:
+    """Background sweep that fixes forum tags which drifted while the bot was offline"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.scan_pacer = Pacer(0.5)  # two API calls per scanned thread
+        self.edit_pacer = Pacer(1.0)
+        self.running = False
+
+    async def initialize_tasks(self):
+        """Start the tag reconciliation background task"""
+        asyncio.create_task(self.reconcile_loop())
+
+    async def reconcile_loop(self):
+        """Run a sweep after startup and then every TAG_RECONCILE_INTERVAL_HOURS"""
+        while True:
+            try:
+                summary = await self.reconcile(dry_run=TAG_RECONCILE_DRY_RUN)
+                if summary["changed"]:
+                    await self.send_summary(summary)
+            except Exception:
+                logger.exception("Error in tag reconcile loop", extra={"event": "tag_reconcile_failed"})
+            await asyncio.sleep(TAG_RECONCILE_INTERVAL_HOURS * 3600)
+
+    async def reconcile(self, dry_run: bool = False) -> dict:
+        """Scan active support posts and correct their tags. Returns a summary of the changes."""
+        summary = {
+            "dry_run": dry_run,
+            "scanned": 0,
+            "changed": 0,
+            "errors": 0,
+            "changes": [],
+            "skipped": False
+        }
+        if self.running:
+            summary["skipped"] = True
+            return summary
+
+        forum = self.bot.get_channel(SUPPORT_CHANNEL_ID)
+        if not isinstance(forum, discord.ForumChannel):
+            return summary
+
+        self.running = True
+        queue: asyncio.Queue = asyncio.Queue()
+        worker = None if dry_run else asyncio.create_task(self.edit_worker(queue, summary))
+        try:
+            for thread in list(forum.threads):
+                if thread.archived or thread.locked:
+                    continue
+                if any(t.id == SOLVED_TAG_ID for t in thread.applied_tags):
+                    continue
+                summary["scanned"] += 1
+                try:
+                    await self.scan_pacer.wait()
+                    new_tags = await self.expected_tags(thread)
+                except discord.HTTPException as e:
+                    summary["errors"] += 1
+                    logger.warning(f"Error scanning thread {thread.id} for tag reconcile: {e}", extra={"event": "tag_scan_failed", "guild_id": thread.guild.id, "thread_id": thread.id})
+                    continue
+
+                old_ids = {t.id for t in thread.applied_tags}
+                new_ids = {t.id for t in new_tags}
+                if old_ids == new_ids:
+                    continue
+                summary["changed"] += 1
+                summary["changes"].append({
+                    "thread_id": thread.id,
+                    "added": [t.name for t in new_tags if t.id not in old_ids],
+                    "removed": [t.name for t in thread.applied_tags if t.id not in new_ids]
+                })
+                if not dry_run:
+                    await queue.put((thread, new_tags))
+
+            if worker:
+                await queue.join()
+        finally:
+            if worker:
+                worker.cancel()
+            self.running = False
+        return summary
+
+    async def expected_tags(self, thread: discord.Thread) -> list:
+        post_creator_id = thread.owner_id
+        starter = thread.starter_message
+        if starter is None:
+            try:
+                starter = await thread.fetch_message(thread.id)
+            except discord.NotFound:
+                starter = None
+        if starter and starter.author == self.bot.user and starter.mentions:
+            post_creator_id = starter.mentions[0].id
+
+        messages = [m async for m in thread.history(limit=HISTORY_LIMIT)]
+        return compute_tags(thread, post_creator_id, messages, self.bot.user.id)
+
+    async def edit_worker(self, queue: asyncio.Queue, summary: dict):
+        """
+        Apply queued tag corrections one at a time. discord.py already waits out and retries
+        rate limits, an HTTPException reaching here means those retries failed too.
+        """
+        while True:
+            thread, new_tags = await queue.get()
+            try:
+                await self.edit_pacer.wait()
+                await thread.edit(applied_tags=new_tags, reason="Tag reconciliation")
+            except Exception as e:
+                summary["errors"] += 1
+                logger.warning(f"Error applying reconciled tags to thread {thread.id}: {e}", extra={"event": "tag_edit_failed", "guild_id": thread.guild.id, "thread_id": thread.id})
+            finally:
+                queue.task_done()
+
+    async def send_summary(self, summary: dict):
+        self.bot.log_sink.log(STARTUP_LOG_THREAD_ID, embed=build_summary_embed(summary))
+
+def build_summary_embed(summary: dict) -> discord.Embed:
+    title = "Tag Reconciliation (dry run)" if summary["dry_run"] else "Tag Reconciliation"
+    embed = discord.Embed(
+        title=title,
+        color=discord.Color.orange() if summary["changed"] else discord.Color.green(),
+        timestamp=discord.utils.utcnow()
+    )
+    if summary["skipped"]:
+        embed.description = "A reconciliation sweep is already running."
+        return embed
+
+    lines = [
+        f"**Scanned:** {summary['scanned']} posts",
+        f"**{'Would change' if summary['dry_run'] else 'Changed'}:** {summary['changed']} posts",
+        f"**Errors:** {summary['errors']}"
+    ]
+    for change in summary["changes"][:15]:
+        parts = []
+        if change["added"]:
+            parts.append("+" + ", +".join(change["added"]))
+        if change["removed"]:
+            parts.append("-" + ", -".join(change["removed"]))
+        lines.append(f"- <#{change['thread_id']}>: {' '.join(parts)}")
+    if len(summary["changes"]) > 15:
+        lines.append(f"...and {len(summary['changes']) - 15} more")
+    embed.description = "\n".join(lines)
+    return embed
@@ -1,13 +1,29 @@
+import logging
+import aiohttp
 import aiosqlite
+import re
 import time
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+FTS_WORD_RE = re.compile(r"\w+")
+
+def search_field(value) -> str:
+    """coolbot.json aliases/keywords may be a string or a list of strings"""
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return " | ".join(str(item) for item in value)
+
 class Database:
     def __init__(self):
         database_dir = Path("database")
         database_dir.mkdir(exist_ok=True)
         self.db_path = database_dir / "bot.db"
+        self.doc_search_enabled = False
 
     async def init(self):
         """Initialize database tables"""
@@ -25,13 +41,36 @@ class Database:
             """)
 
             await db.execute("""
-                CREATE TABLE IF NOT EXISTS pending_closes (
-                    thread_id INTEGER PRIMARY KEY,
-                    close_at INTEGER NOT NULL,
+                CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    due_at INTEGER NOT NULL,
+                    payload TEXT NOT NULL DEFAULT '{}',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
+            # Move closes from the old pending_closes table. close_at held either a relative
+            # delay or an absolute timestamp depending on who scheduled it.
+            async with db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pending_closes'"
+            ) as cursor:
+                has_pending_closes = await cursor.fetchone() is not None
+            if has_pending_closes:
+                await db.execute("""
+                    INSERT OR IGNORE INTO scheduled_jobs (job_id, job_type, due_at, payload)
+                    SELECT
+                        'post_close:' || thread_id,
+                        'post_close',
+                        CASE WHEN close_at < 1000000000
+                            THEN CAST(strftime('%s', created_at) AS INTEGER) + close_at
+                            ELSE close_at
+                        END,
+                        json_object('thread_id', thread_id)
+                    FROM pending_closes
+                """)
+                await db.execute("DROP TABLE pending_closes")
+
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS doc_entries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,6 +79,15 @@ class Database:
                 )
             """)
 
+            # Optional search fields published in coolbot.json, added after the first release
+            async with db.execute("PRAGMA table_info(doc_entries)") as cursor:
+                doc_columns = {row[1] for row in await cursor.fetchall()}
+            for column in ("aliases", "keywords"):
+                if column not in doc_columns:
+                    await db.execute(f"ALTER TABLE doc_entries ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+
+            await self.init_doc_search(db)
+
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS doc_sync_metadata (
                     key TEXT PRIMARY KEY,
@@ -55,6 +103,30 @@ class Database:
                 )
             """)
 
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS github_page_etags (
+                    repo TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    etag TEXT NOT NULL,
+                    next_url TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (repo, page)
+                )
+            """)
+
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS github_repos (
+                    full_name TEXT PRIMARY KEY,
+                    org TEXT NOT NULL,
+                    pushed_at TEXT,
+                    discovery_page INTEGER NOT NULL,
+                    synced_pushed_at TEXT,
+                    last_synced_at TIMESTAMP,
+                    page_count INTEGER NOT NULL DEFAULT 0,
+                    contributor_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS github_verifications (
                     user_id INTEGER PRIMARY KEY,
@@ -64,6 +136,56 @@ class Database:
                 )
             """)
 
+            # Background verification: the username the bio is polled for, added after the first release
+            async with db.execute("PRAGMA table_info(github_verifications)") as cursor:
+                verification_columns = {row[1] for row in await cursor.fetchall()}
+            for column, column_type in (("github_login", "TEXT"), ("guild_id", "INTEGER")):
+                if column not in verification_columns:
+                    await db.execute(f"ALTER TABLE github_verifications ADD COLUMN {column} {column_type}")
+
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS github_links (
+                    discord_id INTEGER PRIMARY KEY,
+                    guild_id INTEGER NOT NULL,
+                    github_login TEXT NOT NULL,
+                    linked_at INTEGER NOT NULL,
+                    role_granted_at INTEGER
+                )
+            """)
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_github_links_login ON github_links(github_login)")
+
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    normalized_title TEXT NOT NULL DEFAULT '',
+                    message TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    user_id INTEGER,
+                    user_name TEXT,
+                    channel_id INTEGER NOT NULL,
+                    message_id INTEGER NOT NULL,
+                    jump_url TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at INTEGER NOT NULL,
+                    sent_at INTEGER,
+                    acknowledged_at INTEGER,
+                    ack_title TEXT,
+                    escalated_at INTEGER
+                )
+            """)
+            # Deduplication by service, added after the page queue
+            async with db.execute("PRAGMA table_info(pages)") as cursor:
+                page_columns = {row[1] for row in await cursor.fetchall()}
+            if "normalized_title" not in page_columns:
+                await db.execute("ALTER TABLE pages ADD COLUMN normalized_title TEXT NOT NULL DEFAULT ''")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_pages_status ON pages(status, sent_at)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_pages_normalized_title ON pages(normalized_title, created_at)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_pages_created ON pages(created_at)")
+
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS autoresponses (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -85,6 +207,50 @@ class Database:
             """)
             await db.commit()
 
+    async def init_doc_search(self, db: aiosqlite.Connection):
+        """Create the FTS5 index over doc entries, kept in sync with doc_entries by triggers"""
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'doc_entries_fts'"
+        ) as cursor:
+            exists = await cursor.fetchone() is not None
+        try:
+            await db.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS doc_entries_fts USING fts5(
+                    name, aliases, keywords,
+                    content='doc_entries', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )
+            """)
+        except aiosqlite.OperationalError as e:
+            # SQLite built without FTS5, /doc-search falls back to the in-memory index
+            logger.warning(f"Doc full-text search disabled: {e}", extra={"event": "doc_fts_disabled"})
+            self.doc_search_enabled = False
+            return
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS doc_entries_fts_insert AFTER INSERT ON doc_entries BEGIN
+                INSERT INTO doc_entries_fts (rowid, name, aliases, keywords)
+                VALUES (new.id, new.name, new.aliases, new.keywords);
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS doc_entries_fts_delete AFTER DELETE ON doc_entries BEGIN
+                INSERT INTO doc_entries_fts (doc_entries_fts, rowid, name, aliases, keywords)
+                VALUES ('delete', old.id, old.name, old.aliases, old.keywords);
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS doc_entries_fts_update AFTER UPDATE ON doc_entries BEGIN
+                INSERT INTO doc_entries_fts (doc_entries_fts, rowid, name, aliases, keywords)
+                VALUES ('delete', old.id, old.name, old.aliases, old.keywords);
+                INSERT INTO doc_entries_fts (rowid, name, aliases, keywords)
+                VALUES (new.id, new.name, new.aliases, new.keywords);
+            END
+        """)
+        if not exists:
+            # Index the entries synced before the FTS table existed
+            await db.execute("INSERT INTO doc_entries_fts (doc_entries_fts) VALUES ('rebuild')")
+        self.doc_search_enabled = True
+
     async def create_tables(self):
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute('''CREATE TABLE IF NOT EXISTS users (
@@ -128,28 +294,36 @@ class Database:
             await db.execute("DELETE FROM persistent_views WHERE message_id = ?", (message_id,))
             await db.commit()
 
+    async def get_view(self, message_id: int):
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM persistent_views WHERE message_id = ?", (message_id,)) as cursor:
+                return await cursor.fetchone()
+
     async def get_all_views(self):
         async with aiosqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM persistent_views") as cursor:
                 return await cursor.fetchall()
 
-    async def get_pending_closes(self):
-        """Fetch all pending close tasks"""
+    async def get_scheduled_jobs(self):
+        """Fetch all scheduled jobs"""
         async with aiosqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
-            async with db.execute("SELECT * FROM pending_closes") as cursor:
+            async with db.execute("SELECT * FROM scheduled_jobs") as cursor:
                 return await cursor.fetchall()
 
-    async def add_close_task(self, thread_id: int, close_at: int):
-        """Add a new thread close task to the database"""
+    async def add_scheduled_job(self, job_id: str, job_type: str, due_at: int, payload: str):
+        """Add or replace a scheduled job"""
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute("""
-                INSERT INTO pending_closes (thread_id, close_at)
-                VALUES (?, ?)
-                ON CONFLICT(thread_id) DO UPDATE SET
-                close_at = excluded.close_at
-            """, (thread_id, close_at))
+                INSERT INTO scheduled_jobs (job_id, job_type, due_at, payload)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                job_type = excluded.job_type,
+                due_at = excluded.due_at,
+                payload = excluded.payload
+            """, (job_id, job_type, due_at, payload))
             await db.commit()
 
     async def mark_view_solved(self, message_id: int, is_solved: bool):
@@ -162,10 +336,10 @@ class Database:
             """, (is_solved, message_id))
             await db.commit()
 
-    async def remove_close_task(self, thread_id: int):
-        """Remove a thread close task from the database"""
+    async def remove_scheduled_job(self, job_id: str):
+        """Remove a scheduled job from the database"""
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM pending_closes WHERE thread_id = ?", (thread_id,))
+            await db.execute("DELETE FROM scheduled_jobs WHERE job_id = ?", (job_id,))
             await db.commit()
 
     # Doc entries methods
@@ -182,6 +356,86 @@ class Database:
             async with db.execute("SELECT * FROM doc_entries") as cursor:
                 return await cursor.fetchall()
 
+    async def apply_doc_entries(self, entries: list, etag: Optional[str] = None) -> dict:
+        """
+        Bring doc entries in line with a fetched payload, keyed by name, writing only the
+        difference (and the new ETag) in one transaction.
+        Returns the diff: {"added": [entry], "removed": [name], "changed": [entry]}.
+        """
+        # Later duplicates win, like the upsert this replaced
+        fetched = {
+            entry["name"]: {
+                "name": entry["name"],
+                "link": entry["link"],
+                "aliases": search_field(entry.get("aliases")),
+                "keywords": search_field(entry.get("keywords"))
+            }
+            for entry in entries
+        }
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT name, link, aliases, keywords FROM doc_entries ORDER BY id") as cursor:
+                stored = {row["name"]: dict(row) for row in await cursor.fetchall()}
+
+            diff = {
+                "added": [entry for name, entry in fetched.items() if name not in stored],
+                "removed": [name for name in stored if name not in fetched],
+                "changed": [
+                    entry for name, entry in fetched.items()
+                    if name in stored and entry != stored[name]
+                ]
+            }
+
+            await db.executemany(
+                "DELETE FROM doc_entries WHERE name = ?",
+                [(name,) for name in diff["removed"]]
+            )
+            await db.executemany(
+                "UPDATE doc_entries SET link = ?, aliases = ?, keywords = ? WHERE name = ?",
+                [(entry["link"], entry["aliases"], entry["keywords"], entry["name"]) for entry in diff["changed"]]
+            )
+            await db.executemany(
+                "INSERT INTO doc_entries (name, link, aliases, keywords) VALUES (?, ?, ?, ?)",
+                [(entry["name"], entry["link"], entry["aliases"], entry["keywords"]) for entry in diff["added"]]
+            )
+            if etag:
+                await db.execute("""
+                    INSERT INTO doc_sync_metadata (key, value)
+                    VALUES ('docs_etag', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """, (etag,))
+            await db.commit()
+        return diff
+
+    async def search_doc_entries(self, query: str, limit: int = 25):
+        """
+        Full-text search over doc names, aliases and keywords, best match first.
+        Every word has to match (as a prefix), falling back to any word matching.
+        Returns None when full-text search is unavailable.
+        """
+        if not self.doc_search_enabled:
+            return None
+        words = FTS_WORD_RE.findall(query.lower())
+        if not words:
+            return []
+        terms = [f'"{word}"*' for word in words]
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            for operator in (" AND ", " OR "):
+                # Name matches weigh more than aliases, aliases more than keywords
+                async with db.execute("""
+                    SELECT doc_entries.name, doc_entries.link
+                    FROM doc_entries_fts
+                    JOIN doc_entries ON doc_entries.id = doc_entries_fts.rowid
+                    WHERE doc_entries_fts MATCH ?
+                    ORDER BY bm25(doc_entries_fts, 10.0, 5.0, 2.0)
+                    LIMIT ?
+                """, (operator.join(terms), limit)) as cursor:
+                    rows = await cursor.fetchall()
+                if rows or len(terms) == 1:
+                    return rows
+            return []
+
     async def clear_doc_entries(self):
         """Clear all doc entries"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -206,10 +460,8 @@ class Database:
                 row = await cursor.fetchone()
                 return row[0] if row else None
 
-    async def sync_docs_from_url(self, url: str) -> tuple[bool, dict]:
-        """Sync docs from URL with ETag checking. Returns (updated, status_info)."""
-        import aiohttp
-        import json
+    async def sync_docs_from_url(self, url: str, session: aiohttp.ClientSession) -> tuple[bool, dict]:
+        """Sync docs from URL with ETag checking, applying only what changed. Returns (updated, status_info)."""
 
         status_info = {
             "url": url,
@@ -218,6 +470,7 @@ class Database:
             "response_status": None,
             "response_etag": None,
             "docs_count": 0,
+            "diff": None,
             "updated": False,
             "error": None
         }
@@ -231,33 +484,28 @@ class Database:
             status_info["used_etag_header"] = True
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    status_info["response_status"] = response.status
-                    status_info["response_etag"] = response.headers.get("ETag")
-
-                    if response.status == 304:  # Not modified
-                        return False, status_info
-                    elif response.status != 200:
-                        status_info["error"] = f"HTTP {response.status}"
-                        return False, status_info
-
-                    new_etag = response.headers.get("ETag")
-                    docs_data = await response.json()
-                    status_info["docs_count"] = len(docs_data)
-
-                    # Clear and repopulate
-                    await self.clear_doc_entries()
-                    for entry in docs_data:
-                        await self.add_doc_entry(entry["name"], entry["link"])
-
-                    status_info["updated"] = True
-
-                    # Update ETag
-                    if new_etag:
-                        await self.set_sync_metadata("docs_etag", new_etag)
-
-                    return True, status_info
+            async with session.get(url, headers=headers) as response:
+                status_info["response_status"] = response.status
+                status_info["response_etag"] = response.headers.get("ETag")
+
+                if response.status == 304:  # Not modified
+                    return False, status_info
+                elif response.status != 200:
+                    status_info["error"] = f"HTTP {response.status}"
+                    return False, status_info
+
+                new_etag = response.headers.get("ETag")
+                docs_data = await response.json()
+                status_info["docs_count"] = len(docs_data)
+
+            # Entries, search index and ETag change together or not at all
+            diff = await self.apply_doc_entries(docs_data, new_etag)
+            status_info["diff"] = diff
+
+            # A new ETag doesn't always mean new content
+            updated = any(diff.values())
+            status_info["updated"] = updated
+            return updated, status_info
         except Exception as e:
             status_info["error"] = str(e)
             return False, status_info
@@ -273,6 +521,80 @@ class Database:
             """, (github_username, contributed_repo_name))
             await db.commit()
 
+    async def add_contributors(self, contributed_repo_name: str, github_usernames: list):
+        """Add all contributors of a repo in one transaction"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany("""
+                INSERT INTO contributors (github_username, contributed_repo_name)
+                VALUES (?, ?)
+                ON CONFLICT(github_username, contributed_repo_name) DO NOTHING
+            """, [(github_username, contributed_repo_name) for github_username in github_usernames])
+            await db.commit()
+
+    async def get_page_etags(self, repo: str) -> dict:
+        """Stored ETags of a paginated listing ("owner/repo" contributors, "org:name" repos), {page: (etag, next_url)}"""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT page, etag, next_url FROM github_page_etags WHERE repo = ?", (repo,)
+            ) as cursor:
+                return {page: (etag, next_url) for page, etag, next_url in await cursor.fetchall()}
+
+    async def set_page_etag(self, repo: str, page: int, etag: str, next_url: Optional[str]):
+        """Remember the ETag (and next page link) of a listing page"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT INTO github_page_etags (repo, page, etag, next_url, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(repo, page) DO UPDATE SET
+                    etag = excluded.etag, next_url = excluded.next_url, updated_at = excluded.updated_at
+            """, (repo, page, etag, next_url))
+            await db.commit()
+
+    # Org repository discovery methods
+    async def set_discovered_repos(self, org: str, page: int, repos: list):
+        """Store one page of the org's repo listing as [(full_name, pushed_at)], dropping repos gone from it"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany("""
+                INSERT INTO github_repos (full_name, org, pushed_at, discovery_page)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(full_name) DO UPDATE SET
+                    pushed_at = excluded.pushed_at, discovery_page = excluded.discovery_page
+            """, [(full_name, org, pushed_at, page) for full_name, pushed_at in repos])
+            placeholders = ",".join("?" * len(repos))
+            await db.execute(
+                f"DELETE FROM github_repos WHERE org = ? AND discovery_page = ? AND full_name NOT IN ({placeholders})",
+                (org, page, *[full_name for full_name, _ in repos])
+            )
+            await db.commit()
+
+    async def prune_discovered_repos(self, org: str, page_count: int):
+        """Drop repos listed on pages past the end of the org's current listing"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("DELETE FROM github_repos WHERE org = ? AND discovery_page > ?", (org, page_count))
+            await db.commit()
+
+    async def get_discovered_repos(self, org: str):
+        """All discovered repos of an org with their sync state"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM github_repos WHERE org = ? ORDER BY full_name", (org,)) as cursor:
+                return await cursor.fetchall()
+
+    async def mark_repo_synced(self, full_name: str, pushed_at: Optional[str], page_count: int):
+        """Record a successful contributors sync of a discovered repo"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                UPDATE github_repos SET
+                    synced_pushed_at = ?,
+                    last_synced_at = CURRENT_TIMESTAMP,
+                    page_count = ?,
+                    contributor_count = (
+                        SELECT COUNT(*) FROM contributors WHERE contributed_repo_name = github_repos.full_name
+                    )
+                WHERE full_name = ?
+            """, (pushed_at, page_count, full_name))
+            await db.commit()
+
     async def get_contributors(self):
         """Get all contributors"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -303,11 +625,8 @@ class Database:
             await db.commit()
 
     # GitHub verification methods
-    async def create_verification_token(self, user_id: int, token: str, expires_in_minutes: int = 24*60):
+    async def create_verification_token(self, user_id: int, token: str, expires_at: int):
         """Create a verification token for a user"""
-        import time
-        expires_at = int(time.time()) + (expires_in_minutes * 60)
-
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute("""
                 INSERT OR REPLACE INTO github_verifications (user_id, verification_token, expires_at)
@@ -315,34 +634,155 @@ class Database:
             """, (user_id, token, expires_at))
             await db.commit()
 
-    async def get_verification_token(self, user_id: int):
-        """Get verification token for a user"""
-        import time
+    async def get_verification_tokens(self):
+        """Get all verification tokens, to restore the in-memory token cache on startup"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM github_verifications") as cursor:
+                return await cursor.fetchall()
+
+    async def remove_verification_token(self, user_id: int, token: Optional[str] = None):
+        """Remove verification token for a user, only if it is still `token` when one is given"""
+        async with aiosqlite.connect(self.db_path) as db:
+            if token is None:
+                await db.execute("DELETE FROM github_verifications WHERE user_id = ?", (user_id,))
+            else:
+                await db.execute(
+                    "DELETE FROM github_verifications WHERE user_id = ? AND verification_token = ?",
+                    (user_id, token)
+                )
+            await db.commit()
+
+    async def queue_verification(self, user_id: int, guild_id: int, github_login: str, expires_at: int):
+        """Attach the GitHub username whose bio gets polled to a user's token"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                UPDATE github_verifications
+                SET github_login = ?, guild_id = ?, expires_at = ?
+                WHERE user_id = ?
+            """, (github_login, guild_id, expires_at, user_id))
+            await db.commit()
+
+    async def link_github_account(self, discord_id: int, guild_id: int, github_login: str):
+        """Store a verified Discord to GitHub account link, replacing any earlier link of the member"""
         current_time = int(time.time())
 
         async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT OR REPLACE INTO github_links (discord_id, guild_id, github_login, linked_at)
+                VALUES (?, ?, ?, ?)
+            """, (discord_id, guild_id, github_login, current_time))
+            await db.commit()
+
+    async def get_linked_contributors_without_role(self):
+        """Get linked members whose GitHub account now has contributions but who weren't granted the role yet"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
             async with db.execute("""
-                SELECT verification_token FROM github_verifications
-                WHERE user_id = ? AND expires_at > ?
-            """, (user_id, current_time)) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else None
+                SELECT links.discord_id, links.guild_id, links.github_login
+                FROM github_links AS links
+                WHERE links.role_granted_at IS NULL
+                AND EXISTS (SELECT 1 FROM contributors WHERE contributors.github_username = links.github_login)
+            """) as cursor:
+                return await cursor.fetchall()
 
-    async def remove_verification_token(self, user_id: int):
-        """Remove verification token for a user"""
+    async def mark_contributor_roles_granted(self, discord_ids: list, granted_at: int):
+        """Record that these linked members have the contributor role"""
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM github_verifications WHERE user_id = ?", (user_id,))
+            await db.executemany(
+                "UPDATE github_links SET role_granted_at = ? WHERE discord_id = ?",
+                [(granted_at, discord_id) for discord_id in discord_ids]
+            )
             await db.commit()
 
-    async def cleanup_expired_tokens(self):
-        """Clean up expired verification tokens"""
-        import time
-        current_time = int(time.time())
+    # Page methods
+    async def add_page(self, page_id: str, title: str, normalized_title: str, message: str, priority: int, user_id: Optional[int],
+                       user_name: Optional[str], channel_id: int, message_id: int, jump_url: str, payload: str):
+        """Store a page before its first delivery attempt"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT INTO pages (
+                    id, title, normalized_title, message, priority, user_id, user_name,
+                    channel_id, message_id, jump_url, payload, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                page_id, title, normalized_title, message, priority, user_id, user_name,
+                channel_id, message_id, jump_url, payload, int(time.time())
+            ))
+            await db.commit()
+
+    async def get_recent_pages(self, normalized_title: str, since: int, limit: int = 10):
+        """Get the latest pages for a service created since `since`, through the (normalized_title, created_at) index"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("""
+                SELECT * FROM pages
+                WHERE normalized_title = ? AND created_at >= ? AND status != 'failed'
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (normalized_title, since, limit)) as cursor:
+                return await cursor.fetchall()
+
+    async def get_page_history(self, normalized_title: Optional[str] = None, limit: int = 10):
+        """Get the latest pages, optionally only those for one service"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            if normalized_title:
+                query = "SELECT * FROM pages WHERE normalized_title = ? ORDER BY created_at DESC LIMIT ?"
+                params = (normalized_title, limit)
+            else:
+                query = "SELECT * FROM pages ORDER BY created_at DESC LIMIT ?"
+                params = (limit,)
+            async with db.execute(query, params) as cursor:
+                return await cursor.fetchall()
+
+    async def get_page(self, page_id: str):
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM pages WHERE id = ?", (page_id,)) as cursor:
+                return await cursor.fetchone()
 
+    async def record_page_attempt(self, page_id: str, attempts: int, status: str, error: Optional[str] = None):
+        """Record a delivery attempt, `status` is 'queued' (retrying), 'sent' or 'failed'"""
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM github_verifications WHERE expires_at <= ?", (current_time,))
+            await db.execute("""
+                UPDATE pages
+                SET attempts = ?, status = ?, last_error = ?,
+                    sent_at = CASE WHEN ? = 'sent' THEN ? ELSE sent_at END
+                WHERE id = ?
+            """, (attempts, status, error, status, int(time.time()), page_id))
+            await db.commit()
+
+    async def mark_page_acknowledged(self, page_id: str, ack_title: str):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                UPDATE pages SET status = 'acknowledged', acknowledged_at = ?, ack_title = ?
+                WHERE id = ?
+            """, (int(time.time()), ack_title, page_id))
+            await db.commit()
+
+    async def mark_page_escalated(self, page_id: str):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("UPDATE pages SET escalated_at = ? WHERE id = ?", (int(time.time()), page_id))
             await db.commit()
 
+    async def get_unacknowledged_pages(self, sent_since: int):
+        """Get pages sent since `sent_since` that are still waiting for an acknowledgement"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute(
+                "SELECT * FROM pages WHERE status = 'sent' AND sent_at >= ?", (sent_since,)
+            ) as cursor:
+                return await cursor.fetchall()
+
+    async def get_queued_pages(self):
+        """Get pages that still have a delivery attempt to come"""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM pages WHERE status = 'queued'") as cursor:
+                return await cursor.fetchall()
+
     # Autoresponses methods
     async def add_autoresponse(self, name: str, regex: str, response_message: str):
         """Add a new autoresponse"""
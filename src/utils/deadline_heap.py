@@ -0,0 +1,52 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Hashable, Optional
+
+class DeadlineHeap:
+    """
+    A min-heap of (deadline, seq, key) driven by a single timer that wakes exactly when the earliest
+    deadline passes and hands the key to `on_due`. The owner keeps the seq returned by push() next
+    to its entry; replacing or removing the entry makes `is_current(seq, key)` false and the stale
+    heap entry is skipped.
+    """
+
+    def __init__(self, is_current: Callable[[int, Hashable], bool], on_due: Callable[[Hashable], None]):
+        self.is_current = is_current
+        self.on_due = on_due
+        self.heap: list = []
+        self.counter = itertools.count(1)
+        self.wakeup: Optional[asyncio.Event] = None
+        self.loop_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the timer, keys pushed before this come due once it runs"""
+        self.wakeup = asyncio.Event()
+        self.loop_task = asyncio.create_task(self.run())
+
+    def push(self, deadline: float, key: Hashable) -> int:
+        """Add `key` due at the absolute `deadline` timestamp. Returns its seq."""
+        seq = next(self.counter)
+        heapq.heappush(self.heap, (deadline, seq, key))
+        if self.wakeup and self.heap[0][1] == seq:
+            self.wakeup.set()  # new earliest deadline, re-arm the timer
+        return seq
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    async def run(self):
+        while True:
+            now = time.time()
+            while self.heap and (self.heap[0][0] <= now or not self.is_current(self.heap[0][1], self.heap[0][2])):
+                _, seq, key = heapq.heappop(self.heap)
+                if self.is_current(seq, key):
+                    self.on_due(key)
+
+            timeout = self.heap[0][0] - now if self.heap else None
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
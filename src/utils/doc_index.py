@@ -0,0 +1,278 @@
+import bisect
+import heapq
+import itertools
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+IDS = ""  # trie node key holding the entry ids below that node, never a real character
+
+# BM25 parameters, the usual defaults
+K1 = 1.2
+B = 0.75
+
+# Extra score for entries matching the whole query, so the old substring hits stay on top
+SUBSTRING_BONUS = 3.0
+PREFIX_BONUS = 1.0
+
+# Term frequency weight of alias and keyword words, name words count 1
+FIELD_WEIGHTS = {"aliases": 0.5, "keywords": 0.25}
+
+FUZZY_MIN_SIMILARITY = 0.35
+MAX_EXPANSIONS = 10
+
+def ngrams(text: str, n: int) -> set:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def term_trigrams(term: str) -> set:
+    """Trigrams of a term padded like pg_trgm, so short terms still have a few"""
+    return ngrams(f"  {term} ", 3)
+
+class DocIndex:
+    """
+    In-memory search index over doc entry names, aliases and keywords.
+
+    Entries are ranked with BM25 over the words of their names, with alias and keyword words
+    counting for less (FIELD_WEIGHTS). Query words that don't exist in any entry are expanded to similar words by trigram similarity (typos), and the last query
+    word also matches as a prefix (autocomplete). A prefix trie and n-gram postings over the
+    whole name boost entries that contain the query as typed.
+    Built from the database at startup and updated with each docs sync diff.
+    """
+
+    def __init__(self):
+        self.entries: List[Optional[dict]] = []  # by id, None once removed
+        self.sources: List[Optional[dict]] = []  # by id, every indexed field, for rebuilds
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}  # entry name -> id
+        self.trie: dict = {}
+        self.grams: Dict[str, List[int]] = {}
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.idf: Dict[str, float] = {}
+        self.terms: List[Dict[str, float]] = []  # by id, weighted term frequencies
+        self.doc_lengths: List[float] = []
+        self.total_length = 0
+        self.avg_length = 1.0
+        self.vocab: List[str] = []
+        self.vocab_trigrams: Dict[str, List[str]] = {}
+
+    def rebuild(self, entries: Iterable):
+        fresh = DocIndex()
+        for entry in entries:
+            fresh.add(entry)
+        fresh.refresh_stats()
+        # Swap everything at once so lookups never see a half-built index
+        self.__dict__.update(fresh.__dict__)
+
+    def update(self, added: Iterable = (), removed: Iterable = (), changed: Iterable = ()):
+        """Apply a docs sync diff, touching only the entries it names"""
+        for name in removed:
+            self.remove(name)
+        for entry in changed:
+            # Entries are keyed by name, a change of link alone leaves the indexed words as they are
+            doc_id = self.ids.get(entry["name"])
+            if doc_id is not None and self.entry_terms(entry) == self.terms[doc_id]:
+                self.entries[doc_id]["link"] = entry["link"]
+                self.sources[doc_id]["link"] = entry["link"]
+            else:
+                self.remove(entry["name"])
+                self.add(entry)
+        for entry in added:
+            self.add(entry)
+        if len(self.entries) > 2 * len(self.ids) + 100:
+            # Mostly removed slots, start over from the live entries
+            self.rebuild([source for source in self.sources if source is not None])
+        else:
+            self.refresh_stats()
+
+    @staticmethod
+    def entry_terms(entry) -> Dict[str, float]:
+        """Weighted term frequencies of an entry's name, aliases and keywords"""
+        counts: Dict[str, float] = {}
+        for word in WORD_RE.findall(entry["name"].lower()):
+            counts[word] = counts.get(word, 0.0) + 1.0
+        for field, weight in FIELD_WEIGHTS.items():
+            if field not in entry.keys():
+                continue
+            for word in WORD_RE.findall((entry[field] or "").lower()):
+                counts[word] = counts.get(word, 0.0) + weight
+        return counts
+
+    def add(self, entry):
+        """Index one entry under the next id (call refresh_stats afterwards)"""
+        doc_id = len(self.entries)
+        name = entry["name"].lower()
+        self.entries.append({"name": entry["name"], "link": entry["link"]})
+        self.sources.append({key: entry[key] for key in ("name", "link", *FIELD_WEIGHTS) if key in entry.keys()})
+        self.names.append(name)
+        self.ids[entry["name"]] = doc_id
+
+        words = WORD_RE.findall(name)
+        counts = self.entry_terms(entry)
+        self.terms.append(counts)
+        self.doc_lengths.append(sum(counts.values()))
+        self.total_length += self.doc_lengths[-1]
+        for word, tf in counts.items():
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = []
+                bisect.insort(self.vocab, word)
+                for gram in term_trigrams(word):
+                    self.vocab_trigrams.setdefault(gram, []).append(word)
+            posting.append((doc_id, tf))
+
+        for word in set(words) | {name}:
+            node = self.trie
+            for char in word:
+                node = node.setdefault(char, {})
+                ids = node.setdefault(IDS, [])
+                if not ids or ids[-1] != doc_id:
+                    ids.append(doc_id)
+        for n in (1, 2, 3):
+            for gram in ngrams(name, n):
+                self.grams.setdefault(gram, []).append(doc_id)
+
+    def remove(self, name: str):
+        """Unindex the entry with this name (call refresh_stats afterwards)"""
+        doc_id = self.ids.pop(name, None)
+        if doc_id is None:
+            return
+        lowered = self.names[doc_id]
+        words = WORD_RE.findall(lowered)
+        for word in self.terms[doc_id]:
+            posting = [item for item in self.postings[word] if item[0] != doc_id]
+            if posting:
+                self.postings[word] = posting
+                continue
+            del self.postings[word]
+            self.vocab.pop(bisect.bisect_left(self.vocab, word))
+            for gram in term_trigrams(word):
+                terms = self.vocab_trigrams[gram]
+                terms.remove(word)
+                if not terms:
+                    del self.vocab_trigrams[gram]
+
+        for word in set(words) | {lowered}:
+            node = self.trie
+            for char in word:
+                node = node[char]
+                ids = node[IDS]
+                if doc_id in ids:
+                    ids.remove(doc_id)
+        for n in (1, 2, 3):
+            for gram in ngrams(lowered, n):
+                ids = self.grams[gram]
+                ids.remove(doc_id)
+                if not ids:
+                    del self.grams[gram]
+
+        self.total_length -= self.doc_lengths[doc_id]
+        self.doc_lengths[doc_id] = 0
+        self.terms[doc_id] = {}
+        self.entries[doc_id] = None
+        self.sources[doc_id] = None
+        self.names[doc_id] = ""
+
+    def refresh_stats(self):
+        """Recompute the collection-wide BM25 statistics after entries were added or removed"""
+        total = len(self.ids)
+        self.idf = {
+            term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+        self.avg_length = (self.total_length / total) if total else 1.0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def prefix_ids(self, query: str) -> List[int]:
+        """Ids of entries where the name or one of its words starts with `query`"""
+        node = self.trie
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(IDS, [])
+
+    def substring_ids(self, query: str) -> List[int]:
+        """Ids of entries whose name contains `query`, in table order"""
+        if len(query) <= 3:
+            return self.grams.get(query, [])
+        postings = [self.grams.get(gram) for gram in ngrams(query, 3)]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+        return [doc_id for doc_id in sorted(candidates) if query in self.names[doc_id]]
+
+    def similar_terms(self, token: str) -> List[Tuple[str, float]]:
+        """Vocabulary terms with a trigram (Jaccard) similarity to `token` above the threshold"""
+        grams = term_trigrams(token)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for term in self.vocab_trigrams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        similar = []
+        for term, count in shared.items():
+            similarity = count / (len(grams) + len(term) + 1 - count)  # a padded term has len + 1 trigrams
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                similar.append((term, similarity))
+        return heapq.nlargest(MAX_EXPANSIONS, similar, key=lambda item: item[1])
+
+    def expand(self, token: str, allow_prefix: bool) -> List[Tuple[str, float]]:
+        """Terms a query word stands for, with a weight: itself, prefix completions and near misses"""
+        expansions: Dict[str, float] = {}
+        if token in self.postings:
+            expansions[token] = 1.0
+        if allow_prefix:
+            start = bisect.bisect_left(self.vocab, token)
+            for term in self.vocab[start:start + MAX_EXPANSIONS]:
+                if not term.startswith(token):
+                    break
+                expansions.setdefault(term, 0.9)
+        if not expansions and len(token) >= 3:
+            for term, similarity in self.similar_terms(token):
+                expansions[term] = similarity
+        return list(expansions.items())
+
+    def scores(self, query: str) -> Dict[int, float]:
+        query = query.lower().strip()
+        tokens = WORD_RE.findall(query)
+        scores: Dict[int, float] = {}
+        for position, token in enumerate(tokens):
+            # A word can expand to several terms, only the best one counts per entry
+            best: Dict[int, float] = {}
+            for term, weight in self.expand(token, allow_prefix=position == len(tokens) - 1):
+                idf = self.idf[term]
+                for doc_id, tf in self.postings[term]:
+                    length_norm = 1 - B + B * self.doc_lengths[doc_id] / self.avg_length
+                    score = weight * idf * tf * (K1 + 1) / (tf + K1 * length_norm)
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        if query:
+            for doc_id in self.substring_ids(query):
+                scores[doc_id] = scores.get(doc_id, 0.0) + SUBSTRING_BONUS
+            for doc_id in self.prefix_ids(query):
+                scores[doc_id] = scores.get(doc_id, 0.0) + PREFIX_BONUS
+        return scores
+
+    def rank(self, query: str, limit: int = 25) -> List[dict]:
+        """Top `limit` entries for `query` in relevance order (ties keep table order)"""
+        if not query.strip():
+            return list(itertools.islice((entry for entry in self.entries if entry is not None), limit))
+        scores = self.scores(query)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [self.entries[doc_id] for doc_id, _ in top]
+
+    def find_exact(self, name: str):
+        """The entry with exactly this name (case-insensitive), e.g. an autocomplete pick"""
+        name = name.lower().strip()
+        for doc_id in self.prefix_ids(name):
+            if self.names[doc_id] == name:
+                return self.entries[doc_id]
+        return None
@@ -0,0 +1,86 @@
+import heapq
+import math
+import re
+from typing import Dict, Iterable, List, Tuple
+
+from utils.database import search_field
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+URL_RE = re.compile(r"https?://\S+")
+
+# Words every support post has, they only add noise to the match
+STOP_WORDS = frozenset("""
+a about after again all also am an and any are as at be because been before being but by can
+cannot could did do does doing don dont for from get got had has have having hello help hey hi
+how i if im in into is it its ive just me my need no not now of on or our out please so some
+still than thank thanks that the their them then there these they this those to too trying
+tried up us use using very was we were what when where which while who why will with would
+you your coolify
+""".split())
+
+def terms(text: str) -> Dict[str, int]:
+    """Term counts of `text`, without code blocks, links and stop words"""
+    text = URL_RE.sub(" ", CODE_BLOCK_RE.sub(" ", text.lower()))
+    counts: Dict[str, int] = {}
+    for word in WORD_RE.findall(text):
+        if len(word) > 1 and word not in STOP_WORDS:
+            counts[word] = counts.get(word, 0) + 1
+    return counts
+
+def weigh(counts: Dict[str, int], idf: Dict[str, float]) -> Dict[str, float]:
+    """Sublinear tf-idf weights, L2 normalized so a dot product is the cosine similarity"""
+    weights = {term: (1 + math.log(tf)) * idf[term] for term, tf in counts.items() if term in idf}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+class DocSuggester:
+    """
+    TF-IDF matcher from support post text to doc entries.
+
+    The doc matrix is stored column-wise (term -> [(entry id, weight)]), so scoring a post
+    only touches the postings of terms it shares with the docs, like a sparse
+    matrix-vector product, instead of comparing against every doc.
+    """
+
+    def __init__(self):
+        self.entries: List[dict] = []
+        self.idf: Dict[str, float] = {}
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+
+    def rebuild(self, entries: Iterable):
+        entries = list(entries)
+        documents = [
+            terms(" ".join(search_field(entry[key]) for key in ("name", "aliases", "keywords") if key in entry.keys()))
+            for entry in entries
+        ]
+        document_frequency: Dict[str, int] = {}
+        for counts in documents:
+            for term in counts:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        total = len(documents)
+        idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_id, counts in enumerate(documents):
+            for term, weight in weigh(counts, idf).items():
+                postings.setdefault(term, []).append((doc_id, weight))
+
+        self.entries = [{"name": entry["name"], "link": entry["link"]} for entry in entries]
+        self.idf, self.postings = idf, postings
+
+    def __len__(self):
+        return len(self.entries)
+
+    def scores(self, text: str) -> Dict[int, float]:
+        """Cosine similarity of `text` to every doc sharing at least one term with it"""
+        scores: Dict[int, float] = {}
+        for term, query_weight in weigh(terms(text), self.idf).items():
+            for doc_id, weight in self.postings[term]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_weight * weight
+        return scores
+
+    def suggest(self, text: str, limit: int = 3, threshold: float = 0.3) -> List[Tuple[dict, float]]:
+        """Up to `limit` (entry, score) pairs scoring at least `threshold`, best first"""
+        top = heapq.nlargest(limit, self.scores(text).items(), key=lambda item: item[1])
+        return [(self.entries[doc_id], score) for doc_id, score in top if score >= threshold]
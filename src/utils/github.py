@@ -0,0 +1,164 @@
+import logging
+import aiohttp
+import time
+from typing import Optional
+from utils.http import HttpClient
+from utils.pacing import Pacer
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Requests kept in hand before the reset, and the share of the quota below which requests get spread out
+RESERVE = 2
+PACE_BELOW = 0.2
+
+MAX_RETRIES = 3
+SECONDARY_LIMIT_DELAY = 60  # GitHub asks to wait at least a minute when it gives no Retry-After
+
+# Seconds a user profile stays cached since it was last fetched or revalidated. Cached profiles are still
+# revalidated with their ETag; a 304 only costs no quota on authenticated requests (with GITHUB_TOKEN).
+PROFILE_CACHE_TTL = 600
+
+class GitHubRateLimited(Exception):
+    """The quota is used up and the reset is further away than the caller wants to wait"""
+
+    def __init__(self, reset_at: float):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub rate limit reached, resets <t:{int(reset_at)}:R>")
+
+class GitHubResponse:
+    __slots__ = ("status", "headers", "links", "data")
+
+    def __init__(self, status: int, headers, links, data):
+        self.status = status
+        self.headers = headers
+        self.links = links
+        self.data = data
+
+    @property
+    def next_url(self) -> Optional[str]:
+        next_link = self.links.get("next")
+        return str(next_link["url"]) if next_link else None
+
+class GitHubClient:
+    """
+    GitHub REST client shared by every GitHub call. Tracks the rate limit headers, spreads
+    requests out when the quota runs low, waits for the reset when it is used up and
+    retries rate-limited responses after the advertised delay.
+    """
+
+    def __init__(self, http: HttpClient, token: Optional[str] = None):
+        self.http = http
+        self.token = token
+        self.pacer = Pacer(0)
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.requests = 0
+        self.retries = 0
+        self.profiles = TTLCache()  # lowercased login -> (etag, profile)
+        self.profile_stats = {"fetched": 0, "revalidated": 0}
+
+    def start(self):
+        self.profiles.start()
+
+    def headers(self) -> dict:
+        headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    async def get(self, url: str, headers: Optional[dict] = None, max_wait: float = 3600) -> GitHubResponse:
+        """
+        GET an API path or full URL. JSON is only parsed for 200 responses.
+        Raises GitHubRateLimited if getting through would mean waiting longer than `max_wait` seconds.
+        """
+        if url.startswith("/"):
+            url = GITHUB_API_URL + url
+        headers = {**self.headers(), **(headers or {})}
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self.throttle(max_wait)
+            self.requests += 1
+            async with self.http.session.get(url, headers=headers) as response:
+                self.update_quota(response.headers)
+                delay = await self.retry_delay(response)
+                if delay is None or attempt == MAX_RETRIES:
+                    data = await response.json() if response.status == 200 else None
+                    return GitHubResponse(response.status, response.headers, response.links, data)
+
+            if delay > max_wait:
+                raise GitHubRateLimited(time.time() + delay)
+            self.retries += 1
+            logger.info(f"GitHub rate limited {url} (HTTP {response.status}), retrying in {delay:.0f}s", extra={"event": "github_rate_limited"})
+            self.pacer.defer(delay)
+
+    async def get_user(self, login: str, max_wait: float = 3600) -> Optional[dict]:
+        """
+        A user's profile, None if the account doesn't exist. Repeated lookups of the same user send the
+        cached ETag and are answered from the cache when GitHub replies 304 Not Modified.
+        """
+        key = login.lower()
+        cached = self.profiles.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self.get(f"/users/{login}", headers=headers, max_wait=max_wait)
+        if response.status == 304 and cached:
+            self.profile_stats["revalidated"] += 1
+            self.profiles.set(key, cached, time.time() + PROFILE_CACHE_TTL)
+            return cached[1]
+        if response.status == 404:
+            self.profiles.pop(key)
+            return None
+        if response.status != 200:
+            raise Exception(f"HTTP {response.status} fetching GitHub user {login}")
+
+        self.profile_stats["fetched"] += 1
+        etag = response.headers.get("ETag")
+        if etag:
+            self.profiles.set(key, (etag, response.data), time.time() + PROFILE_CACHE_TTL)
+        return response.data
+
+    def update_quota(self, headers):
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        self.remaining = int(headers["X-RateLimit-Remaining"])
+        self.limit = int(headers.get("X-RateLimit-Limit", self.limit or 0))
+        self.reset_at = float(headers.get("X-RateLimit-Reset", self.reset_at))
+
+    async def retry_delay(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, None if it isn't rate limited"""
+        if response.status not in (403, 429):
+            return None
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, self.reset_at - time.time()) + 1
+        if response.status == 429 or "secondary rate limit" in (await response.text()).lower():
+            return SECONDARY_LIMIT_DELAY
+        # Any other 403 is a permission error, not a rate limit
+        return None
+
+    async def throttle(self, max_wait: float):
+        """Wait for a request slot, slowing down as the quota runs out"""
+        now = time.time()
+        if self.remaining is not None and now < self.reset_at:
+            until_reset = self.reset_at - now
+            if self.remaining <= RESERVE:
+                if until_reset > max_wait:
+                    raise GitHubRateLimited(self.reset_at)
+                self.pacer.defer(until_reset + 1)
+            elif self.limit and self.remaining < self.limit * PACE_BELOW:
+                # Spread what is left evenly until the reset
+                self.pacer.interval = until_reset / (self.remaining - RESERVE)
+            else:
+                self.pacer.interval = 0
+            # Count the request now, concurrent callers see the quota it will use
+            self.remaining -= 1
+        else:
+            self.pacer.interval = 0  # the quota was reset, whatever spread the old one no longer applies
+        if self.pacer.delay() > max_wait:
+            # Queued behind a retry or other paced requests for longer than the caller can wait
+            raise GitHubRateLimited(time.time() + self.pacer.delay())
+        await self.pacer.wait()
@@ -0,0 +1,67 @@
+import aiohttp
+from typing import Dict, Optional
+
+# Connection pool sizing: total open connections, and per host so one slow API can't take them all
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 10
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+# Defaults for every request, call sites can still pass their own timeout
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+class HttpClient:
+    """
+    The bot-wide aiohttp session. Created once at startup and closed on shutdown, so every
+    outbound call shares pooled keep-alive connections and cached DNS. Counts requests,
+    responses, errors and connection reuse per host.
+    """
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    async def start(self):
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL
+        )
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self.on_request_start)
+        trace.on_request_end.append(self.on_request_end)
+        trace.on_request_exception.append(self.on_request_exception)
+        trace.on_connection_create_end.append(self.on_connection_create_end)
+        trace.on_connection_reuseconn.append(self.on_connection_reuseconn)
+        # trust_env so HTTP(S)_PROXY settings apply, like the ntfy sessions had before
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=DEFAULT_TIMEOUT,
+            trust_env=True,
+            trace_configs=[trace]
+        )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    def count(self, host: str, key: str):
+        host_stats = self.stats.setdefault(host, {})
+        host_stats[key] = host_stats.get(key, 0) + 1
+
+    async def on_request_start(self, session, context, params):
+        context.host = params.url.host or "unknown"
+        self.count(context.host, "requests")
+
+    async def on_request_end(self, session, context, params):
+        self.count(context.host, f"{params.response.status // 100}xx")
+
+    async def on_request_exception(self, session, context, params):
+        self.count(context.host, "errors")
+
+    async def on_connection_create_end(self, session, context, params):
+        self.count(context.host, "new_connections")
+
+    async def on_connection_reuseconn(self, session, context, params):
+        self.count(context.host, "reused_connections")
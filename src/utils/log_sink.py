@@ -0,0 +1,135 @@
+import asyncio
+import collections
+import logging
+import time
+import discord
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Discord's limits for one message
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBEDS = 10
+MAX_EMBEDS_LENGTH = 6000
+
+# Entries are held this long to be packed with the ones that follow, unless a message is already full
+FLUSH_INTERVAL = 2.0
+
+# Entries waiting per destination, beyond this new ones are dropped until the backlog drains
+MAX_PENDING = 100
+
+class LogEntry:
+    __slots__ = ("content", "embed")
+
+    def __init__(self, content: Optional[str], embed: Optional[discord.Embed]):
+        self.content = content
+        self.embed = embed
+
+class LogDestination:
+    __slots__ = ("entries", "dropped", "sent_at", "full", "task")
+
+    def __init__(self):
+        self.entries: Deque[LogEntry] = collections.deque()
+        self.dropped = 0
+        self.sent_at: Deque[float] = collections.deque()  # send times within the budget window
+        self.full = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+class LogSink:
+    """
+    Buffers log entries per destination channel and sends them packed into as few messages as
+    possible, once a message is full or FLUSH_INTERVAL passed. Each destination gets at most
+    `budget` messages per minute, so log bursts can't starve user-facing replies of rate limit.
+    Entries over the MAX_PENDING backlog are dropped and counted in the next message.
+    """
+
+    def __init__(self, bot, budget: int = 20):
+        self.bot = bot
+        self.budget = budget
+        self.destinations: Dict[int, LogDestination] = {}
+        self.stats = {"entries": 0, "messages": 0, "dropped": 0}
+
+    def log(self, channel_id: int, content: Optional[str] = None, embed: Optional[discord.Embed] = None):
+        """Queue a log entry for `channel_id`. Never waits on Discord."""
+        destination = self.destinations.get(channel_id)
+        if destination is None:
+            destination = self.destinations[channel_id] = LogDestination()
+        if len(destination.entries) >= MAX_PENDING:
+            destination.dropped += 1
+            self.stats["dropped"] += 1
+            return
+        destination.entries.append(LogEntry(content, embed))
+        self.stats["entries"] += 1
+        if self.fills_message(destination.entries):
+            destination.full.set()
+        if destination.task is None or destination.task.done():
+            destination.task = asyncio.create_task(self.flush_loop(channel_id, destination))
+
+    async def flush_loop(self, channel_id: int, destination: LogDestination):
+        """Send the destination's entries until none are left"""
+        while destination.entries:
+            try:
+                await asyncio.wait_for(destination.full.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self.wait_for_budget(destination)
+            destination.full.clear()
+            content, embeds = self.pack(destination)
+            if destination.dropped and len(content) < MAX_CONTENT_LENGTH - 60:
+                content += f"\n-# {destination.dropped} log entries dropped, log budget exceeded"
+                destination.dropped = 0
+            await self.send(channel_id, content.strip(), embeds)
+            if self.fills_message(destination.entries):
+                destination.full.set()
+
+    async def wait_for_budget(self, destination: LogDestination):
+        now = time.monotonic()
+        while destination.sent_at and destination.sent_at[0] <= now - 60:
+            destination.sent_at.popleft()
+        if len(destination.sent_at) >= self.budget:
+            await asyncio.sleep(destination.sent_at[0] + 60 - now)
+            destination.sent_at.popleft()
+        destination.sent_at.append(time.monotonic())
+
+    @staticmethod
+    def fills_message(entries) -> bool:
+        content_length = sum(len(entry.content) + 1 for entry in entries if entry.content)
+        embed_count = sum(1 for entry in entries if entry.embed)
+        return content_length >= MAX_CONTENT_LENGTH or embed_count >= MAX_EMBEDS
+
+    @staticmethod
+    def pack(destination: LogDestination):
+        """Take as many entries, in order, as fit in one message"""
+        lines: List[str] = []
+        embeds: List[discord.Embed] = []
+        content_length = 0
+        embeds_length = 0
+        while destination.entries:
+            entry = destination.entries[0]
+            entry_length = len(entry.content) + 1 if entry.content else 0
+            embed_length = len(entry.embed) if entry.embed else 0
+            fits = (
+                content_length + entry_length <= MAX_CONTENT_LENGTH
+                and (entry.embed is None or (len(embeds) < MAX_EMBEDS and embeds_length + embed_length <= MAX_EMBEDS_LENGTH))
+            )
+            if not fits and (lines or embeds):
+                break
+            destination.entries.popleft()
+            if entry.content:
+                lines.append(entry.content[:MAX_CONTENT_LENGTH - 1])
+                content_length += entry_length
+            if entry.embed:
+                embeds.append(entry.embed)
+                embeds_length += embed_length
+        return "\n".join(lines), embeds
+
+    async def send(self, channel_id: int, content: str, embeds: List[discord.Embed]):
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            logger.warning(f"Log channel with ID {channel_id} not found, dropping its log entries", extra={"event": "log_channel_missing"})
+            return
+        try:
+            await channel.send(content=content or None, embeds=embeds)
+            self.stats["messages"] += 1
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to send logs to {channel_id}: {e}", extra={"event": "log_send_failed"})
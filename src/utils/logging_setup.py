@@ -0,0 +1,80 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from typing import Dict
+
+# Extra fields copied into each JSON line when a log call passes them, e.g.
+# logger.info("...", extra={"event": "post_closed", "guild_id": guild.id, "thread_id": thread.id})
+STRUCTURED_FIELDS = ("event", "guild_id", "thread_id", "latency_ms")
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                line[field] = round(value, 1) if field == "latency_ms" else value
+        if record.exc_text:
+            line["exc"] = record.exc_text
+        return json.dumps(line, default=str, ensure_ascii=False)
+
+class LoopSafeQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread without formatting them on the event loop. Only the
+    message and traceback are rendered here, since the args may change before the listener runs.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def parse_levels(levels: str) -> Dict[str, int]:
+    """Parse `logger=LEVEL` pairs separated by commas, e.g. "tasks.docs_sync=DEBUG,discord=WARNING" """
+    parsed = {}
+    for pair in levels.split(","):
+        name, _, level = pair.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if not name or not level:
+            continue
+        if not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Unknown log level {level!r} for {name!r}")
+        parsed[name] = logging.getLevelName(level)
+    return parsed
+
+def setup_logging(level: str = "INFO", levels: str = "") -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to a listener thread that writes JSON lines to stdout,
+    so a slow log driver never blocks the event loop. `levels` overrides the level per logger
+    (and its children), see parse_levels().
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+    listener = logging.handlers.QueueListener(log_queue, output)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(LoopSafeQueueHandler(log_queue))
+    root.setLevel(level.upper())
+    for name, logger_level in parse_levels(levels).items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    listener.start()
+    atexit.register(listener.stop)  # flushes what is still queued
+    return listener
@@ -0,0 +1,25 @@
+import asyncio
+import time
+
+class Pacer:
+    """Spaces out calls so that at most one goes through every `interval` seconds"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_at = 0.0
+
+    async def wait(self):
+        """Wait for the next free slot. Slots are reserved before sleeping, so concurrent callers queue up in order"""
+        now = time.monotonic()
+        slot = max(now, self._next_at)
+        self._next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def delay(self) -> float:
+        """Seconds until the next free slot"""
+        return max(0.0, self._next_at - time.monotonic())
+
+    def defer(self, seconds: float):
+        """Push the next slot back, e.g. after a 429 with a retry_after"""
+        self._next_at = max(self._next_at, time.monotonic() + seconds)
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from utils.deadline_heap import DeadlineHeap
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """
+    A dict whose entries expire at their own deadline. Lookups are plain dict hits; a DeadlineHeap
+    wakes exactly when the earliest entry expires and hands it to `on_expire`. Re-setting or
+    popping a key leaves a stale heap entry that is skipped.
+    """
+
+    def __init__(self, on_expire: Optional[Callable[[Hashable, Any], Awaitable[None]]] = None):
+        self.on_expire = on_expire
+        self.entries: Dict[Hashable, Tuple[float, int, Any]] = {}  # key -> (expires_at, seq, value)
+        self.deadlines = DeadlineHeap(self.is_current, self.on_due)
+        self.running: set = set()
+
+    def start(self):
+        """Start the expiry timer, entries added before this expire once it runs"""
+        self.deadlines.start()
+
+    def set(self, key: Hashable, value: Any, expires_at: float):
+        """Add or replace `key`, expiring at the absolute `expires_at` timestamp"""
+        seq = self.deadlines.push(expires_at, key)
+        self.entries[key] = (expires_at, seq, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            return default  # expired entries are left to the timer, it runs on_expire for them
+        return entry[2]
+
+    def expires_at(self, key: Hashable) -> Optional[float]:
+        entry = self.entries.get(key)
+        return entry[0] if entry else None
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.entries.pop(key, None)
+        return entry[2] if entry else default
+
+    def items(self):
+        """Live (key, value) pairs"""
+        now = time.time()
+        return [(key, value) for key, (expires_at, _, value) in self.entries.items() if expires_at > now]
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and entry[0] > time.time()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def is_current(self, seq: int, key: Hashable) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and entry[1] == seq
+
+    def on_due(self, key: Hashable):
+        _, _, value = self.entries.pop(key)
+        if self.on_expire is not None:
+            task = asyncio.create_task(self.expire(key, value))
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+
+    async def expire(self, key: Hashable, value: Any):
+        try:
+            await self.on_expire(key, value)
+        except Exception:
+            logger.exception(f"Error expiring cache entry {key}", extra={"event": "cache_expire_failed"})